@@ -4,6 +4,13 @@ using UnityEngine.UI;
 using UnityEngine.EventSystems;
 using System.IO;
 using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Net;
+using System.Net.Sockets;
+using System.Security.Cryptography;
+using System.Text;
+using System.Threading;
 
 namespace Kiro.Unity.MCP
 {
@@ -13,9 +20,252 @@ namespace Kiro.Unity.MCP
         private static string commandFile = "Temp/KiroCommands/command.txt";
         private static string resultFile = "Temp/KiroCommands/result.txt";
         
+        // Queued commands: the MCP server drops sq/<id>.cmd and waits for cq/<id>.res,
+        // so concurrent requests never share a command or result file
+        private static string submissionDir = "Temp/KiroCommands/sq";
+        private static string completionDir = "Temp/KiroCommands/cq";
+        // Listing the queue allocates, so it is scanned at most this often rather than every update tick
+        private const double SubmissionScanInterval = 0.05;
+        private static double nextSubmissionScan;
+        
+        // Loopback channel: the MCP server connects to the port published in portFile and
+        // sends each batch of commands as one frame (little-endian int32 length, then UTF-8
+        // JSON), getting one frame of results back. Its first frame must be the token published
+        // next to the port, so only processes that can read Temp can drive the editor
+        private static string portFile = "Temp/KiroCommands/port.txt";
+        private const string HandshakeReply = "ready";
+        private static string channelToken;
+        private static readonly UTF8Encoding channelEncoding = new UTF8Encoding(false);
+        // Frames above this are treated as a corrupt stream rather than allocated
+        private const int MaxFrameLength = 16 * 1024 * 1024;
+        private static TcpListener listener;
+        private static readonly List<TcpClient> clients = new List<TcpClient>();
+        private static readonly ConcurrentQueue<ChannelRequest> channelRequests = new ConcurrentQueue<ChannelRequest>();
+        
+        [Serializable]
+        private class ChannelCommand
+        {
+            public string id;
+            public string command;
+        }
+        
+        [Serializable]
+        private class ChannelResult
+        {
+            public string id;
+            public string result;
+        }
+        
+        [Serializable]
+        private class ChannelBatch
+        {
+            public ChannelCommand[] commands;
+        }
+        
+        [Serializable]
+        private class ChannelResults
+        {
+            public ChannelResult[] results;
+        }
+        
+        private class ChannelRequest
+        {
+            public string payload;
+            public NetworkStream stream;
+        }
+        
         static KiroCommandProcessor()
         {
             EditorApplication.update += CheckForCommands;
+            
+            StartChannel();
+            AssemblyReloadEvents.beforeAssemblyReload += StopChannel;
+            EditorApplication.quitting += StopChannel;
+        }
+        
+        private static void StartChannel()
+        {
+            try
+            {
+                listener = new TcpListener(IPAddress.Loopback, 0);
+                listener.Start();
+                
+                byte[] secret = new byte[16];
+                using (var rng = RandomNumberGenerator.Create())
+                {
+                    rng.GetBytes(secret);
+                }
+                channelToken = BitConverter.ToString(secret).Replace("-", "");
+                
+                int port = ((IPEndPoint)listener.LocalEndpoint).Port;
+                Directory.CreateDirectory(Path.GetDirectoryName(portFile));
+                WriteAtomically(portFile, port + "\n" + channelToken);
+                
+                new Thread(AcceptClients) { IsBackground = true, Name = "Kiro command channel" }.Start(listener);
+            }
+            catch (Exception e)
+            {
+                Debug.LogWarning($"Kiro: Command channel unavailable, using command files: {e.Message}");
+                listener = null;
+            }
+        }
+        
+        private static void StopChannel()
+        {
+            if (listener == null)
+            {
+                return;
+            }
+            
+            listener.Stop();
+            listener = null;
+            
+            // Close open connections so the server sees EOF and reconnects after the reload
+            lock (clients)
+            {
+                foreach (TcpClient client in clients)
+                {
+                    client.Close();
+                }
+                clients.Clear();
+            }
+            
+            try
+            {
+                File.Delete(portFile);
+            }
+            catch (IOException)
+            {
+            }
+        }
+        
+        private static void AcceptClients(object state)
+        {
+            var server = (TcpListener)state;
+            try
+            {
+                while (true)
+                {
+                    TcpClient client = server.AcceptTcpClient();
+                    lock (clients)
+                    {
+                        clients.Add(client);
+                    }
+                    new Thread(ReadClient) { IsBackground = true, Name = "Kiro command client" }.Start(client);
+                }
+            }
+            catch (SocketException)
+            {
+                // Listener stopped
+            }
+            catch (ObjectDisposedException)
+            {
+            }
+        }
+        
+        // Runs on a background thread: only queues frames, commands themselves run on the main thread
+        private static void ReadClient(object state)
+        {
+            var client = (TcpClient)state;
+            try
+            {
+                NetworkStream stream = client.GetStream();
+                var reader = new BinaryReader(stream, channelEncoding);
+                
+                // Answered here rather than on the main thread, so the server can tell a live
+                // editor from a stale port within its handshake deadline even mid-import
+                string token = ReadFrame(reader);
+                if (token != channelToken)
+                {
+                    if (token != null)
+                    {
+                        Debug.LogWarning("Kiro: Dropping command channel client that sent the wrong token");
+                    }
+                    return;
+                }
+                WriteFrame(stream, HandshakeReply);
+                
+                string payload;
+                while ((payload = ReadFrame(reader)) != null)
+                {
+                    channelRequests.Enqueue(new ChannelRequest { payload = payload, stream = stream });
+                }
+            }
+            catch (IOException)
+            {
+            }
+            catch (ObjectDisposedException)
+            {
+            }
+            catch (Exception e)
+            {
+                Debug.LogError($"Kiro: Command channel client error: {e.Message}");
+            }
+            finally
+            {
+                lock (clients)
+                {
+                    clients.Remove(client);
+                }
+                client.Close();
+            }
+        }
+        
+        // Null once the server has disconnected
+        private static string ReadFrame(BinaryReader reader)
+        {
+            byte[] header = reader.ReadBytes(4);
+            if (header.Length < 4)
+            {
+                return null;
+            }
+            
+            int length = header[0] | header[1] << 8 | header[2] << 16 | header[3] << 24;
+            if (length < 0 || length > MaxFrameLength)
+            {
+                Debug.LogWarning($"Kiro: Dropping command channel client after an invalid frame length ({(uint)length} bytes)");
+                return null;
+            }
+            
+            byte[] payload = reader.ReadBytes(length);
+            return payload.Length < length ? null : channelEncoding.GetString(payload);
+        }
+        
+        private static void WriteFrame(Stream stream, string payload)
+        {
+            int length = channelEncoding.GetByteCount(payload);
+            byte[] frame = new byte[4 + length];
+            frame[0] = (byte)length;
+            frame[1] = (byte)(length >> 8);
+            frame[2] = (byte)(length >> 16);
+            frame[3] = (byte)(length >> 24);
+            channelEncoding.GetBytes(payload, 0, payload.Length, frame, 4);
+            stream.Write(frame, 0, frame.Length);
+        }
+        
+        private static void ProcessChannelRequest(ChannelRequest request)
+        {
+            try
+            {
+                ChannelCommand[] commands = JsonUtility.FromJson<ChannelBatch>(request.payload).commands;
+                var results = new ChannelResult[commands.Length];
+                for (int i = 0; i < commands.Length; i++)
+                {
+                    results[i] = new ChannelResult { id = commands[i].id, result = ProcessCommand(commands[i].command) };
+                }
+                WriteFrame(request.stream, JsonUtility.ToJson(new ChannelResults { results = results }));
+            }
+            catch (IOException)
+            {
+                // The server disconnected before the result was ready
+            }
+            catch (ObjectDisposedException)
+            {
+            }
+            catch (Exception e)
+            {
+                Debug.LogError($"Kiro: Command processing error: {e.Message}");
+            }
         }
         
         private static void CheckForCommands()
@@ -30,13 +280,66 @@ namespace Kiro.Unity.MCP
                     string result = ProcessCommand(command);
                     
                     Directory.CreateDirectory(Path.GetDirectoryName(resultFile));
-                    File.WriteAllText(resultFile, result);
+                    WriteAtomically(resultFile, result);
                 }
                 catch (Exception e)
                 {
                     Debug.LogError($"Kiro: Command processing error: {e.Message}");
                 }
             }
+            
+            double now = EditorApplication.timeSinceStartup;
+            if (now >= nextSubmissionScan)
+            {
+                nextSubmissionScan = now + SubmissionScanInterval;
+                if (Directory.Exists(submissionDir))
+                {
+                    foreach (string submission in Directory.GetFiles(submissionDir, "*.cmd"))
+                    {
+                        ProcessQueuedCommand(submission);
+                    }
+                }
+            }
+            
+            while (channelRequests.TryDequeue(out ChannelRequest request))
+            {
+                ProcessChannelRequest(request);
+            }
+        }
+        
+        private static void ProcessQueuedCommand(string submission)
+        {
+            try
+            {
+                string id = Path.GetFileNameWithoutExtension(submission);
+                string command = File.ReadAllText(submission).Trim();
+                File.Delete(submission);
+                
+                string result = ProcessCommand(command);
+                
+                Directory.CreateDirectory(completionDir);
+                WriteAtomically(Path.Combine(completionDir, id + ".res"), result);
+            }
+            catch (Exception e)
+            {
+                Debug.LogError($"Kiro: Command processing error: {e.Message}");
+            }
+        }
+        
+        // Write under a temporary name and rename so the server never reads a partial result
+        private static void WriteAtomically(string path, string contents)
+        {
+            string pending = path + ".tmp";
+            File.WriteAllText(pending, contents);
+            if (File.Exists(path))
+            {
+                // Swap in place, so readers never see the file missing between a delete and a move
+                File.Replace(pending, path, null);
+            }
+            else
+            {
+                File.Move(pending, path);
+            }
         }
         
         private static string ProcessCommand(string command)
@@ -101,6 +404,9 @@ namespace Kiro.Unity.MCP
                         UnitySceneInspector.SaveSceneInfoToFile();
                         return "Scene info saved";
                         
+                    case "get_scene_info":
+                        return JsonUtility.ToJson(UnitySceneInspector.GetCurrentSceneInfo(), true);
+                        
                     case "get_hierarchy":
                         Debug.Log("Kiro: Processing get_hierarchy command");
                         string hierarchyResult = GetSimpleHierarchy();
@@ -166,6 +472,17 @@ namespace Kiro.Unity.MCP
                         
 
                         
+                    case "refresh":
+                        string reason = parts.Length > 1 ? string.Join("|", parts, 1, parts.Length - 1) : "MCP request";
+                        Debug.Log($"Kiro: Refreshing assets ({reason})");
+                        // Older servers refreshed by touching this sentinel; remove it so upgraded projects don't keep it
+                        File.Delete("Assets/.kiro_refresh_trigger.cs");
+                        File.Delete("Assets/.kiro_refresh_trigger.cs.meta");
+                        // Run after this update tick, so the acknowledgement goes out before the import
+                        // starts; a default refresh only recompiles if scripts actually changed
+                        EditorApplication.delayCall += () => AssetDatabase.Refresh(ImportAssetOptions.Default);
+                        return "Asset refresh scheduled";
+                        
                     case "cleanup_screenshots":
                         int keepCount = parts.Length > 1 && int.TryParse(parts[1], out int count) ? count : 5;
                         UnityScreenshotCapture.CleanupOldScreenshots(keepCount);
@@ -5,14 +5,35 @@ Unity MCP Server - Simple Unity project integration for Kiro AI
 
 import asyncio
 import json
+import mmap
 import os
 import sys
 import re
 import subprocess
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict, defaultdict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
 # MCP imports
 from mcp.server import Server, NotificationOptions
 from mcp.server.models import InitializationOptions
@@ -26,6 +47,491 @@ from mcp.types import (
 # Initialize the MCP server
 server = Server("unity-mcp")
 
+def _dumps(obj: Any) -> str:
+    """Serialize a payload as compact JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, default=str)
+
+# Editor version line in ProjectSettings/ProjectVersion.txt
+_EDITOR_VERSION_RE = re.compile(rb'^m_EditorVersion:[ \t]*(.*?)\s*$', re.MULTILINE)
+
+# Characters stripped from requested script names
+_SCRIPT_NAME_RE = re.compile(r'[^a-zA-Z0-9_]')
+
+# Largest script unity_read_script will return in one response
+_MAX_SCRIPT_BYTES = 2 * 1024 * 1024
+
+# Simple MonoBehaviour template, pre-encoded around the class name
+_SCRIPT_TEMPLATE_HEAD = b"using UnityEngine;\n\npublic class "
+_SCRIPT_TEMPLATE_TAIL = b""" : MonoBehaviour
+{
+    void Start()
+    {
+        
+    }
+    
+    void Update()
+    {
+        
+    }
+}"""
+# Sanitized script names never contain a newline, so every generated script has this many lines
+_SCRIPT_TEMPLATE_LINES = _SCRIPT_TEMPLATE_HEAD.count(b"\n") + _SCRIPT_TEMPLATE_TAIL.count(b"\n") + 1
+
+# Assets listings are keyed on the Assets folder mtime, which only changes when
+# its direct children change, so cached listings also expire after this many seconds
+_LISTING_TTL = 5.0
+
+# Set UNITY_MCP_DEBUG to include parser diagnostics in scene payloads
+_DEBUG = bool(os.environ.get("UNITY_MCP_DEBUG"))
+
+# Shared pool for blocking file operations; main() installs it as the loop's
+# default executor so asyncio.to_thread uses it too
+_FILE_POOL = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4), thread_name_prefix="unity-fs")
+
+# Worker pool for directory scans - Assets subtrees are walked concurrently.
+# Kept apart from _FILE_POOL because a scan submitted there waits on these workers
+_SCAN_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix="unity-scan")
+
+# Caps how many blocking inspector calls run at once so bulk requests don't swamp the disk
+_BLOCKING_SLOTS = asyncio.Semaphore(os.cpu_count() or 4)
+
+# Result file name -> future of the file-queue command waiting on it. One dispatcher
+# task checks for all of them, woken by the watchdog observer when results land
+_result_waiters: Dict[str, asyncio.Future] = {}
+_results_arrived = asyncio.Event()
+_result_dispatcher: Optional[asyncio.Task] = None
+_result_observer = None
+
+def _wake_result_dispatcher(path: str):
+    """Wake the dispatcher if path is a result someone is waiting for"""
+    if os.path.basename(path) in _result_waiters:
+        _results_arrived.set()
+
+if Observer is not None:
+    class _CompletionHandler(FileSystemEventHandler):
+        """Forward result files appearing in the completion folder to the event loop"""
+        
+        def __init__(self, loop: asyncio.AbstractEventLoop):
+            self.loop = loop
+        
+        def on_created(self, event):
+            self.loop.call_soon_threadsafe(_wake_result_dispatcher, event.src_path)
+        
+        def on_moved(self, event):
+            self.loop.call_soon_threadsafe(_wake_result_dispatcher, event.dest_path)
+
+def _start_result_watcher(directory: Path):
+    """Watch for command results instead of polling for them, when watchdog is installed"""
+    global _result_observer
+    if Observer is None or _result_observer is not None:
+        return
+    
+    observer = Observer()
+    observer.daemon = True
+    observer.schedule(_CompletionHandler(asyncio.get_running_loop()), str(directory))
+    observer.start()
+    _result_observer = observer
+
+def _take_result(result_file: Path) -> Optional[str]:
+    """Read and remove a command result; None until Unity has renamed it into place"""
+    try:
+        fd = os.open(result_file, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    except FileNotFoundError:
+        return None
+    try:
+        # Results are renamed into place whole, so one read of the stat size gets everything
+        data = os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+    
+    result_text = data.decode('utf-8', 'replace').strip()
+    result_file.unlink()  # Clean up
+    return result_text
+
+def _collect_results(directory: Path, names: frozenset) -> Dict[str, str]:
+    """Take whichever of the awaited results are present, listing the folder once for all of them"""
+    try:
+        with os.scandir(directory) as it:
+            present = [entry.name for entry in it if entry.name in names]
+    except FileNotFoundError:
+        return {}
+    
+    found = {}
+    for name in present:
+        result_text = _take_result(directory / name)
+        if result_text is not None:
+            found[name] = result_text
+    return found
+
+async def _dispatch_results(directory: Path):
+    """Resolve every pending file-queue wait from one loop, however many commands are in flight"""
+    delay = 0.005
+    # Watched folders only poll as a safety net for filesystems that drop events
+    max_delay = 0.5 if _result_observer is not None else 0.1
+    
+    while True:
+        if not _result_waiters:
+            await _results_arrived.wait()
+        # Cleared before the check, so anything landing during it triggers another one
+        _results_arrived.clear()
+        
+        found = await asyncio.to_thread(_collect_results, directory, frozenset(_result_waiters))
+        for name, result_text in found.items():
+            future = _result_waiters.pop(name, None)
+            if future is not None and not future.done():
+                future.set_result(result_text)
+        
+        # New commands and watcher events restart the backoff from a fast check, so quick
+        # commands return within a few milliseconds
+        try:
+            await asyncio.wait_for(_results_arrived.wait(), delay)
+            delay = 0.005
+        except asyncio.TimeoutError:
+            delay = min(delay * 1.6, max_delay)
+
+async def _wait_for_result(result_file: Path, timeout: float = 5.0) -> Optional[str]:
+    """Wait for Unity to write a command result, then read and remove it; None on timeout"""
+    global _result_dispatcher
+    if _result_dispatcher is None or _result_dispatcher.done():
+        _result_dispatcher = _spawn(_dispatch_results(result_file.parent))
+    
+    future = _result_waiters[result_file.name] = asyncio.get_running_loop().create_future()
+    _results_arrived.set()
+    try:
+        return await asyncio.wait_for(future, timeout)
+    except asyncio.TimeoutError:
+        return None
+    finally:
+        _result_waiters.pop(result_file.name, None)
+
+# Fire-and-forget tasks; the event loop only keeps weak references to running tasks
+_background_tasks = set()
+
+def _spawn(coro) -> asyncio.Task:
+    """Run a coroutine in the background, keeping it alive until it finishes"""
+    task = asyncio.get_running_loop().create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+def _publish(path: Path, text: str):
+    """Write text next to path and rename it into place, so Unity sees either no file or all of it"""
+    pending = path.with_suffix(".tmp")
+    data = text.encode('utf-8')
+    try:
+        pending.write_bytes(data)
+    except FileNotFoundError:
+        # The command folders are created at startup; recreate them if Temp was cleared since
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pending.write_bytes(data)
+    os.replace(pending, path)
+
+class _CommandChannel:
+    """Loopback connection to KiroCommandProcessor's listener, sending queued commands in batches"""
+    
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.pending: "asyncio.Queue[Tuple[str, str]]" = asyncio.Queue()
+        self.futures: Dict[str, asyncio.Future] = {}
+        self.tasks = (_spawn(self._pump()), _spawn(self._receive()))
+    
+    @property
+    def closed(self) -> bool:
+        return self.reader.at_eof() or self.writer.is_closing()
+    
+    def submit(self, command: str) -> Tuple[str, asyncio.Future]:
+        """Queue a command for the next batch, returning its id and the future for its result"""
+        command_id = uuid.uuid4().hex
+        future = self.futures[command_id] = asyncio.get_running_loop().create_future()
+        self.pending.put_nowait((command_id, command))
+        return command_id, future
+    
+    async def _pump(self):
+        """Write everything queued since the last write as one frame, so a burst of tool calls costs one editor tick"""
+        while True:
+            batch = [await self.pending.get()]
+            while not self.pending.empty():
+                batch.append(self.pending.get_nowait())
+            
+            commands = [{"id": command_id, "command": command} for command_id, command in batch]
+            payload = _dumps({"commands": commands}).encode()
+            self.writer.write(len(payload).to_bytes(4, "little") + payload)
+            try:
+                await self.writer.drain()
+            except OSError:
+                self.close()
+                return
+    
+    async def _receive(self):
+        """Resolve each command's future as its batch of results arrives, reading each frame in one go"""
+        try:
+            while True:
+                header = await self.reader.readexactly(4)
+                payload = await self.reader.readexactly(int.from_bytes(header, "little"))
+                for item in json.loads(payload)["results"]:
+                    future = self.futures.pop(item["id"], None)
+                    if future is not None and not future.done():
+                        future.set_result(item["result"])
+        except (asyncio.IncompleteReadError, OSError, ValueError):
+            pass  # Disconnected, e.g. by a domain reload
+        finally:
+            self.close()
+    
+    def close(self):
+        """Disconnect, reporting commands still in flight as timed out rather than resending them"""
+        self.writer.close()
+        current = asyncio.current_task()
+        for task in self.tasks:
+            if task is not current:
+                task.cancel()
+        for future in self.futures.values():
+            if not future.done():
+                future.set_result(None)
+        self.futures.clear()
+
+# Opened on first use and reopened after the editor drops it (e.g. on a domain reload)
+_channel: Optional[_CommandChannel] = None
+_channel_lock = asyncio.Lock()
+
+# The port.txt stamp whose handshake last failed, so a stale file left by a crashed editor
+# costs one handshake rather than one per command
+_failed_port_stamp: Optional[Tuple[int, int]] = None
+
+async def _handshake(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, token: str):
+    """Present the editor's token and wait briefly for it to answer; TimeoutError/OSError if it doesn't"""
+    payload = token.encode()
+    writer.write(len(payload).to_bytes(4, "little") + payload)
+    await writer.drain()
+    try:
+        header = await asyncio.wait_for(reader.readexactly(4), 1.0)
+        reply = await asyncio.wait_for(reader.readexactly(int.from_bytes(header, "little")), 1.0)
+    except asyncio.IncompleteReadError:
+        raise ConnectionError("Command channel closed during the handshake") from None
+    if reply != b"ready":
+        raise ConnectionError("Unexpected handshake reply from the command channel")
+
+async def _open_channel() -> _CommandChannel:
+    """Connect to the port the editor published; OSError/ValueError if it isn't listening"""
+    global _channel, _failed_port_stamp
+    async with _channel_lock:
+        if _channel is None or _channel.closed:
+            port_file = inspector.port_file
+            stat = await asyncio.to_thread(port_file.stat)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            if stamp == _failed_port_stamp:
+                raise ConnectionError("Command channel port file is stale")
+            
+            # "<port>\n<token>"; a package that predates the token writes only the port
+            port, token = (await asyncio.to_thread(port_file.read_text)).split()
+            try:
+                reader, writer = await asyncio.wait_for(
+                    asyncio.open_connection("127.0.0.1", int(port)), 1.0)
+            except (OSError, asyncio.TimeoutError):
+                _failed_port_stamp = stamp
+                raise
+            try:
+                await _handshake(reader, writer, token)
+            except (OSError, asyncio.TimeoutError):
+                _failed_port_stamp = stamp
+                writer.close()
+                raise
+            except BaseException:
+                writer.close()
+                raise
+            _failed_port_stamp = None
+            _channel = _CommandChannel(reader, writer)
+        return _channel
+
+async def _preconnect_channel():
+    """Open the channel ahead of the first tool call; commands fall back to files if it isn't there"""
+    try:
+        await _open_channel()
+    except (OSError, ValueError, asyncio.TimeoutError):
+        pass
+
+async def _send_command(command: str, timeout: float = 5.0) -> Optional[str]:
+    """Send a command to Unity's KiroCommandProcessor and wait for its result; None on timeout"""
+    try:
+        channel = await _open_channel()
+    except (OSError, ValueError, asyncio.TimeoutError):
+        channel = None  # No listener (older package, or the editor is reloading): use the file queue
+    
+    if channel is not None:
+        command_id, future = channel.submit(command)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            channel.futures.pop(command_id, None)
+            return None
+    
+    # Every command gets its own submission/completion pair, so concurrent tool calls never collide
+    command_id = uuid.uuid4().hex
+    submission = inspector.submission_dir / f"{command_id}.cmd"
+    
+    await asyncio.to_thread(_publish, submission, command)
+    
+    try:
+        result_text = await _wait_for_result(inspector.completion_dir / f"{command_id}.res", timeout)
+    except asyncio.CancelledError:
+        # The tool call was abandoned (e.g. the client went away); withdraw it the same way
+        submission.unlink(missing_ok=True)
+        raise
+    if result_text is None:
+        # Withdraw the command if Unity never picked it up, so it doesn't run late
+        try:
+            await asyncio.to_thread(submission.unlink)
+        except FileNotFoundError:
+            pass
+    return result_text
+
+async def _run_blocking(fn, *args):
+    """Run a blocking inspector call on the file pool without stalling the event loop"""
+    async with _BLOCKING_SLOTS:
+        return await asyncio.get_running_loop().run_in_executor(_FILE_POOL, fn, *args)
+
+# Parsed scenes keyed on (resolved path, mtime_ns, size); callers only serialize
+# the cached dicts, so hits are returned as-is
+_SCENE_CACHE_SIZE = 32
+_SCENE_CACHE: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+_SCENE_CACHE_LOCK = threading.Lock()
+
+# Scene YAML: document headers and the fields the parser extracts
+_DOC_HEADER_RE = re.compile(rb'^--- !u!(\d+) &(-?\d+)', re.MULTILINE)
+_NAME_RE = re.compile(rb'm_Name:([^\r\n]*)')
+_ACTIVE_RE = re.compile(rb'm_IsActive:[ \t]*([01])')
+_ENABLED_RE = re.compile(rb'm_Enabled:[ \t]*([01])')
+_GO_REF_RE = re.compile(rb'm_GameObject:\s*\{fileID:\s*(-?\d+)\}')
+_SCRIPT_GUID_RE = re.compile(rb'm_Script:[^\r\n]*guid:\s*([0-9a-fA-F]+)')
+# Every Transform field we read is an inline map, so one alternation finds them all in a single pass
+_TRANSFORM_FIELD_RE = re.compile(rb'^[ \t]*(m_GameObject|m_LocalRotation|m_LocalPosition|m_LocalScale|m_Father):[ \t]*\{([^}\r\n]*)\}', re.MULTILINE)
+
+# Shared Transform defaults; parsed scenes only ever replace these, never mutate them
+_DEFAULT_POSITION = {"x": 0, "y": 0, "z": 0}
+_DEFAULT_ROTATION = {"x": 0, "y": 0, "z": 0, "w": 1}
+_DEFAULT_SCALE = {"x": 1, "y": 1, "z": 1}
+
+def _file_id(raw: bytes) -> str:
+    """Decode a fileID, interning it since every reference to an object repeats it"""
+    return sys.intern(raw.decode('ascii'))
+
+# Scene component class IDs the parser understands
+_COMPONENT_TYPES = {20: "Camera", 81: "AudioListener", 114: "MonoBehaviour"}
+
+# File suffixes searched for each unity_search_assets asset_type
+_ASSET_SUFFIXES = {
+    "script": (".cs",),
+    "scene": (".unity",),
+    "prefab": (".prefab",),
+    "material": (".mat",),
+    "texture": (".png", ".jpg", ".jpeg", ".tga"),
+    "audio": (".wav", ".mp3", ".ogg"),
+}
+_ALL_ASSET_SUFFIXES = tuple(suffix for group in _ASSET_SUFFIXES.values() for suffix in group)
+
+# Build/cache folders that sometimes end up under Assets; Unity also skips folders ending in ~
+_PRUNE_DIRS = frozenset({"Library", "Temp", "obj", "bin", ".git", "node_modules", ".vs"})
+
+def _is_pruned(name: str) -> bool:
+    """Whether the scanner should skip a directory entirely"""
+    return name in _PRUNE_DIRS or name.endswith('~')
+
+def _iter_scene_documents(path: Path):
+    """Yield (classID, fileID, body) for each "--- !u!" document of a memory-mapped scene"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Only one document body is copied out of the page cache at a time
+            header = None
+            for match in _DOC_HEADER_RE.finditer(mm):
+                if header is not None:
+                    yield int(header.group(1)), _file_id(header.group(2)), mm[header.end():match.start()]
+                header = match
+            if header is not None:
+                yield int(header.group(1)), _file_id(header.group(2)), mm[header.end():]
+
+def _read_capped(path: Path, limit: int) -> Tuple[int, Optional[bytes]]:
+    """Read a file's bytes with one open/fstat/read, or only its size when it exceeds limit"""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size > limit:
+            return size, None
+        return size, f.read()
+
+def _create_exclusive(path: Path, data: bytes) -> bool:
+    """Create path holding data with raw os-level writes; False if the file already exists"""
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o644)
+    except FileExistsError:
+        return False
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return True
+
+def _scan_dir(path: str, suffixes: Tuple[str, ...]) -> Tuple[List[os.DirEntry], List[str]]:
+    """Read one directory, returning files matching suffixes and the subdirectories to visit next"""
+    matches = []
+    subdirs = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                # Unity does not import hidden entries
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if not _is_pruned(entry.name):
+                        subdirs.append(entry.path)
+                elif entry.name.endswith(suffixes):
+                    matches.append(entry)
+    except OSError:
+        pass
+    return matches, subdirs
+
+def _count_tree(root: str) -> Tuple[Counter, int, int]:
+    """Walk a directory tree once, counting files by extension plus total files and subfolders"""
+    extensions = Counter()
+    files = 0
+    subfolders = 0
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.name.startswith('.'):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        if not _is_pruned(entry.name):
+                            subfolders += 1
+                            stack.append(entry.path)
+                    else:
+                        files += 1
+                        extensions[entry.name.rpartition('.')[2].lower()] += 1
+        except OSError:
+            continue
+    return extensions, files, subfolders
+
+@lru_cache(maxsize=16)
+def _find_project_root(start_path: str) -> Optional[Path]:
+    """Walk up from start_path, reading each level with one scandir call"""
+    current = Path(start_path).resolve()
+    while current.parent != current:
+        try:
+            with os.scandir(current) as it:
+                names = {entry.name for entry in it if entry.is_dir()}
+        except OSError:
+            names = set()
+        if "ProjectSettings" in names and "Assets" in names:
+            return current
+        current = current.parent
+    return None
+
 class UnityProjectInspector:
     def __init__(self, project_root: str):
         self.project_root = Path(project_root)
@@ -33,18 +539,65 @@ class UnityProjectInspector:
         self.project_settings_path = self.project_root / "ProjectSettings"
         self.packages_path = self.project_root / "Packages"
         self.library_path = self.project_root / "Library"
+        self.version_file = self.project_settings_path / "ProjectVersion.txt"
+        # Scanned entry paths start with these, so relative paths are plain slices
+        self._root_prefix = str(self.project_root) + os.sep
+        self._assets_prefix = str(self.assets_path) + os.sep
+        self._root_posix_prefix = self.project_root.as_posix() + "/"
+        # Command files polled by KiroCommandProcessor inside the editor
+        self.command_dir = self.project_root / "Temp" / "KiroCommands"
+        self.submission_dir = self.command_dir / "sq"
+        self.completion_dir = self.command_dir / "cq"
+        self.port_file = self.command_dir / "port.txt"
+        self._cache: Dict[str, Tuple[Any, float, Any]] = {}
+    
+    def _cached(self, key: str, token: Any, build, ttl: Optional[float] = None) -> Any:
+        """Return the memoized result for key while its invalidation token is unchanged"""
+        now = time.monotonic()
+        hit = self._cache.get(key)
+        if hit is not None and hit[0] == token and now < hit[1]:
+            return hit[2]
+        
+        value = build()
+        self._cache[key] = (token, now + ttl if ttl is not None else float("inf"), value)
+        return value
+    
+    def relative_path(self, path: Any) -> str:
+        """Path relative to the project root, sliced off the cached prefix instead of Path.relative_to"""
+        path = str(path)
+        return path[len(self._root_prefix):] if path.startswith(self._root_prefix) else path
+    
+    def relative_unity_path(self, path: str) -> str:
+        """Normalize a path reported by the editor (either separator, absolute or relative) to a project-relative posix path"""
+        path = path.replace("\\", "/")
+        return path[len(self._root_posix_prefix):] if path.startswith(self._root_posix_prefix) else path
+    
+    def _mtime_token(self, path: Path) -> Optional[int]:
+        """Single-stat invalidation token for a file or folder"""
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+    
+    def ensure_command_dirs(self):
+        """Create the command folders once so each command only has to write its file"""
+        self.submission_dir.mkdir(parents=True, exist_ok=True)
+        self.completion_dir.mkdir(parents=True, exist_ok=True)
+    
+    def invalidate_cache(self):
+        """Drop all cached listings, e.g. after the server writes into Assets"""
+        self._cache.clear()
     
     def find_unity_project_root(self, start_path: str) -> Optional[Path]:
         """Find Unity project root by looking for ProjectSettings folder"""
-        current = Path(start_path).resolve()
-        while current.parent != current:
-            if (current / "ProjectSettings").exists() and (current / "Assets").exists():
-                return current
-            current = current.parent
-        return None
+        return _find_project_root(str(start_path))
     
     def get_project_info(self) -> Dict[str, Any]:
         """Get basic Unity project information"""
+        return self._cached("project_info", self._mtime_token(self.version_file), self._read_project_info)
+    
+    def _read_project_info(self) -> Dict[str, Any]:
+        """Read project information from disk"""
         info = {
             "project_root": str(self.project_root),
             "unity_version": "Unknown",
@@ -52,99 +605,131 @@ class UnityProjectInspector:
         }
         
         # Try to get Unity version from ProjectVersion.txt
-        version_file = self.project_settings_path / "ProjectVersion.txt"
-        if version_file.exists():
-            try:
-                content = version_file.read_text()
-                for line in content.split('\n'):
-                    if line.startswith('m_EditorVersion:'):
-                        info["unity_version"] = line.split(':', 1)[1].strip()
-                        break
-            except Exception:
-                pass
+        try:
+            match = _EDITOR_VERSION_RE.search(self.version_file.read_bytes())
+            if match:
+                info["unity_version"] = match.group(1).decode('ascii', 'replace')
+        except Exception:
+            pass
                 
         return info
     
+    def _scan(self, suffixes: Tuple[str, ...]) -> List[os.DirEntry]:
+        """Find files under Assets by suffix, reading each directory level in parallel on the scan pool"""
+        matches, frontier = _scan_dir(str(self.assets_path), suffixes)
+        
+        # Breadth-first: every directory of a level is read concurrently, so deep or
+        # lopsided trees still overlap their readdir calls instead of walking one subtree at a time
+        while frontier:
+            next_frontier = []
+            for found, subdirs in _SCAN_POOL.map(_scan_dir, frontier, repeat(suffixes)):
+                matches.extend(found)
+                next_frontier.extend(subdirs)
+            frontier = next_frontier
+        
+        return matches
+    
     def list_scenes(self) -> List[Dict[str, Any]]:
         """List all scenes in the project"""
-        scenes = []
-        
-        for scene_file in self.assets_path.rglob("*.unity"):
-            scenes.append({
-                "name": scene_file.stem,
-                "path": str(scene_file.relative_to(self.project_root)),
-                "size": scene_file.stat().st_size if scene_file.exists() else 0
-            })
-        
-        return scenes
+        return self._scan_assets()[0]
     
     def list_scripts(self) -> List[Dict[str, Any]]:
         """List all C# scripts in the project"""
-        scripts = []
-        
-        for script_file in self.assets_path.rglob("*.cs"):
-            scripts.append({
-                "name": script_file.stem,
-                "path": str(script_file.relative_to(self.project_root)),
-                "size": script_file.stat().st_size,
-                "folder": str(script_file.parent.relative_to(self.assets_path))
-            })
-        
-        return scripts
+        return self._scan_assets()[1]
+    
+    def _scan_assets(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Build the scene and script listings from one pass over Assets"""
+        return self._cached("assets", self._mtime_token(self.assets_path), self._build_asset_listings, _LISTING_TTL)
+    
+    def _build_asset_listings(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Scan Assets once and split the results into scenes and scripts"""
+        scene_entries = []
+        script_entries = []
+        for entry in self._scan((".unity", ".cs")):
+            (scene_entries if entry.name.endswith(".unity") else script_entries).append(entry)
+        
+        # DirEntry.stat() is cached from the scan
+        root_len = len(self._root_prefix)
+        scenes = [{
+            "name": entry.name.rpartition('.')[0],
+            "path": entry.path[root_len:],
+            "size": entry.stat().st_size
+        } for entry in scene_entries]
+        
+        return scenes, self._describe_entries(script_entries)
+    
+    def _describe_entries(self, entries: List[os.DirEntry]) -> List[Dict[str, Any]]:
+        """Turn scanned entries into name/path/size/folder listings"""
+        root_len = len(self._root_prefix)
+        assets_len = len(self._assets_prefix)
+        dirname = os.path.dirname
+        
+        return [{
+            "name": entry.name.rpartition('.')[0],
+            "path": entry.path[root_len:],
+            "size": entry.stat().st_size,
+            "folder": dirname(entry.path)[assets_len:] or "."
+        } for entry in entries]
     
     def parse_scene_file(self, scene_path: Path) -> Dict[str, Any]:
         """Parse Unity scene file to extract GameObjects and components"""
         try:
-            content = scene_path.read_text(encoding='utf-8')
-            
+            st = os.stat(scene_path)
+        except OSError:
+            return self._parse_scene_file(scene_path)
+        
+        key = (str(scene_path.resolve()), st.st_mtime_ns, st.st_size)
+        with _SCENE_CACHE_LOCK:
+            scene_data = _SCENE_CACHE.get(key)
+            if scene_data is not None:
+                _SCENE_CACHE.move_to_end(key)
+                return scene_data
+        
+        scene_data = self._parse_scene_file(scene_path)
+        with _SCENE_CACHE_LOCK:
+            _SCENE_CACHE[key] = scene_data
+            if len(_SCENE_CACHE) > _SCENE_CACHE_SIZE:
+                _SCENE_CACHE.popitem(last=False)
+        return scene_data
+    
+    def _parse_scene_file(self, scene_path: Path) -> Dict[str, Any]:
+        """Parse a scene file from disk"""
+        try:
             # Unity scene files are YAML-based but with custom format
             # We'll parse them manually to extract GameObject information
             scene_data = {
                 "name": scene_path.stem,
-                "path": str(scene_path.relative_to(self.project_root)),
+                "path": self.relative_path(scene_path),
                 "gameObjects": [],
                 "components": [],
                 "error": None
             }
             
-            # Split content into documents (Unity uses --- separators)
-            documents = content.split('--- !u!')
-            
             gameobjects = []
             transforms = []
             components = []
             
-            # Debug: add document count to scene data
-            scene_data["debug_document_count"] = len(documents)
+            document_count = 0
             
-            for doc in documents:
-                if not doc.strip():
-                    continue
-                    
-                lines = doc.strip().split('\n')
-                if not lines:
-                    continue
-                    
-                first_line = lines[0]
+            for class_id, file_id, doc in _iter_scene_documents(scene_path):
+                document_count += 1
                 
-                # Parse GameObject entries (look for type 1 which is GameObject)
-                if first_line.startswith('1 &') and 'GameObject:' in doc:
-                    go_data = self._parse_gameobject_document(doc)
+                if class_id == 1:
+                    go_data = self._parse_gameobject_document(file_id, doc)
                     if go_data:
                         gameobjects.append(go_data)
-                
-                # Parse Transform components (look for type 4 which is Transform)
-                elif first_line.startswith('4 &') and 'Transform:' in doc:
-                    transform_data = self._parse_transform_document(doc)
+                elif class_id == 4:
+                    transform_data = self._parse_transform_document(file_id, doc)
                     if transform_data:
                         transforms.append(transform_data)
-                
-                # Parse other components (Camera is type 20, AudioListener is type 81, etc.)
-                elif (first_line.startswith('20 &') or first_line.startswith('81 &') or first_line.startswith('114 &')) and any(comp_name in doc for comp_name in ['Camera:', 'AudioListener:', 'MonoBehaviour:']):
-                    comp_data = self._parse_component_document(doc, first_line)
+                elif class_id in _COMPONENT_TYPES:
+                    comp_data = self._parse_component_document(file_id, doc, _COMPONENT_TYPES[class_id])
                     if comp_data:
                         components.append(comp_data)
             
+            if _DEBUG:
+                scene_data["debug_document_count"] = document_count
+            
             # Link GameObjects with their transforms and components
             scene_data["gameObjects"] = self._link_scene_objects(gameobjects, transforms, components)
             scene_data["summary"] = {
@@ -158,145 +743,105 @@ class UnityProjectInspector:
         except Exception as e:
             return {
                 "name": scene_path.stem,
-                "path": str(scene_path.relative_to(self.project_root)),
+                "path": self.relative_path(scene_path),
                 "error": f"Failed to parse scene: {str(e)}",
                 "gameObjects": [],
                 "components": []
             }
     
-    def _parse_gameobject_document(self, doc: str) -> Optional[Dict[str, Any]]:
+    def _parse_gameobject_document(self, file_id: str, doc: bytes) -> Optional[Dict[str, Any]]:
         """Parse a GameObject document from Unity scene"""
-        try:
-            lines = doc.strip().split('\n')
-            go_data = {"type": "GameObject", "fileID": None, "name": "Unknown", "active": True, "components": []}
-            
-            for line in lines:
-                line = line.strip()
-                if line.startswith('&'):
-                    # Extract fileID
-                    go_data["fileID"] = line.split('&')[1].split()[0] if '&' in line else None
-                elif 'm_Name:' in line:
-                    go_data["name"] = line.split('m_Name:')[1].strip()
-                elif 'm_IsActive:' in line:
-                    go_data["active"] = '1' in line
-                elif 'm_Component:' in line:
-                    # Components will be linked later
-                    pass
-            
-            return go_data if go_data["fileID"] else None
-            
-        except Exception:
-            return None
+        go_data = {"type": "GameObject", "fileID": file_id, "name": "Unknown", "active": True, "components": []}
+        
+        match = _NAME_RE.search(doc)
+        if match:
+            go_data["name"] = match.group(1).decode('utf-8', 'replace').strip()
+        match = _ACTIVE_RE.search(doc)
+        if match:
+            go_data["active"] = match.group(1) == b'1'
+        
+        # Components are linked later
+        return go_data
     
-    def _parse_transform_document(self, doc: str) -> Optional[Dict[str, Any]]:
+    def _parse_transform_document(self, file_id: str, doc: bytes) -> Optional[Dict[str, Any]]:
         """Parse a Transform component document"""
         try:
-            lines = doc.strip().split('\n')
             transform_data = {
                 "type": "Transform", 
-                "fileID": None, 
+                "fileID": file_id, 
                 "gameObject": None,
-                "position": {"x": 0, "y": 0, "z": 0},
-                "rotation": {"x": 0, "y": 0, "z": 0, "w": 1},
-                "scale": {"x": 1, "y": 1, "z": 1},
+                "position": _DEFAULT_POSITION,
+                "rotation": _DEFAULT_ROTATION,
+                "scale": _DEFAULT_SCALE,
                 "parent": None,
                 "children": []
             }
             
-            for line in lines:
-                line = line.strip()
-                if line.startswith('&'):
-                    transform_data["fileID"] = line.split('&')[1].split()[0] if '&' in line else None
-                elif 'm_GameObject:' in line and 'fileID:' in line:
-                    transform_data["gameObject"] = line.split('fileID:')[1].strip().split('}')[0]
-                elif 'm_LocalPosition:' in line:
-                    # Position parsing will be in next few lines
-                    pass
-                elif line.startswith('x:') and 'position' not in str(transform_data.get('_parsing', '')):
-                    transform_data["position"]["x"] = float(line.split(':')[1].strip()) if ':' in line else 0
-                elif line.startswith('y:') and 'position' not in str(transform_data.get('_parsing', '')):
-                    transform_data["position"]["y"] = float(line.split(':')[1].strip()) if ':' in line else 0
-                elif line.startswith('z:') and 'position' not in str(transform_data.get('_parsing', '')):
-                    transform_data["position"]["z"] = float(line.split(':')[1].strip()) if ':' in line else 0
+            for field, body in _TRANSFORM_FIELD_RE.findall(doc):
+                if field == b'm_GameObject':
+                    transform_data["gameObject"] = _file_id(body.partition(b':')[2].strip())
+                elif field == b'm_Father':
+                    parent = body.partition(b':')[2].strip()
+                    if parent != b'0':
+                        transform_data["parent"] = _file_id(parent)
+                else:
+                    # Unity always writes the components in x, y, z(, w) order
+                    values = [float(part.partition(b':')[2]) for part in body.split(b',')]
+                    if field == b'm_LocalPosition':
+                        transform_data["position"] = dict(zip("xyz", values))
+                    elif field == b'm_LocalRotation':
+                        transform_data["rotation"] = dict(zip("xyzw", values))
+                    else:
+                        transform_data["scale"] = dict(zip("xyz", values))
             
             return transform_data if transform_data["fileID"] else None
             
         except Exception:
             return None
     
-    def _parse_component_document(self, doc: str, first_line: str) -> Optional[Dict[str, Any]]:
+    def _parse_component_document(self, file_id: str, doc: bytes, comp_type: str) -> Optional[Dict[str, Any]]:
         """Parse a component document"""
-        try:
-            lines = doc.strip().split('\n')
-            
-            # Determine component type from first line
-            comp_type = "Unknown"
-            if 'MonoBehaviour' in first_line:
-                comp_type = "MonoBehaviour"
-            elif 'MeshRenderer' in first_line:
-                comp_type = "MeshRenderer"
-            elif 'Camera' in first_line:
-                comp_type = "Camera"
-            elif 'Light' in first_line:
-                comp_type = "Light"
-            
-            comp_data = {
-                "type": comp_type,
-                "fileID": None,
-                "gameObject": None,
-                "enabled": True,
-                "properties": {}
-            }
-            
-            for line in lines:
-                line = line.strip()
-                if line.startswith('&'):
-                    comp_data["fileID"] = line.split('&')[1].split()[0] if '&' in line else None
-                elif 'm_GameObject:' in line and 'fileID:' in line:
-                    comp_data["gameObject"] = line.split('fileID:')[1].strip().split('}')[0]
-                elif 'm_Enabled:' in line:
-                    comp_data["enabled"] = '1' in line
-                elif 'm_Script:' in line and comp_type == "MonoBehaviour":
-                    # Try to extract script name
-                    if 'guid:' in line:
-                        comp_data["properties"]["script_guid"] = line.split('guid:')[1].strip().split(',')[0]
-            
-            return comp_data if comp_data["fileID"] else None
-            
-        except Exception:
-            return None
+        comp_data = {
+            "type": comp_type,
+            "fileID": file_id,
+            "gameObject": None,
+            "enabled": True,
+            "properties": {}
+        }
+        
+        match = _GO_REF_RE.search(doc)
+        if match:
+            comp_data["gameObject"] = _file_id(match.group(1))
+        match = _ENABLED_RE.search(doc)
+        if match:
+            comp_data["enabled"] = match.group(1) == b'1'
+        if comp_type == "MonoBehaviour":
+            match = _SCRIPT_GUID_RE.search(doc)
+            if match:
+                comp_data["properties"]["script_guid"] = match.group(1).decode('ascii')
+        
+        return comp_data
     
     def _link_scene_objects(self, gameobjects: List[Dict], transforms: List[Dict], components: List[Dict]) -> List[Dict[str, Any]]:
         """Link GameObjects with their transforms and components"""
         # Create lookup dictionaries
         transform_by_go = {t["gameObject"]: t for t in transforms if t.get("gameObject")}
-        components_by_go = {}
+        components_by_go = defaultdict(list)
         
         for comp in components:
             go_id = comp.get("gameObject")
             if go_id:
-                if go_id not in components_by_go:
-                    components_by_go[go_id] = []
                 components_by_go[go_id].append(comp)
         
-        # Link everything together
-        linked_objects = []
+        # Link everything together in one pass; GameObjects without components share an empty tuple
         for go in gameobjects:
             go_id = go["fileID"]
-            
-            # Add transform
-            if go_id in transform_by_go:
-                go["transform"] = transform_by_go[go_id]
-            
-            # Add components
-            if go_id in components_by_go:
-                go["components"] = components_by_go[go_id]
-            else:
-                go["components"] = []
-            
-            linked_objects.append(go)
+            transform = transform_by_go.get(go_id)
+            if transform is not None:
+                go["transform"] = transform
+            go["components"] = components_by_go.get(go_id, ())
         
-        return linked_objects
+        return gameobjects
     
     def get_scene_hierarchy(self, scene_path: str) -> Dict[str, Any]:
         """Get detailed scene hierarchy and GameObject information"""
@@ -309,57 +854,104 @@ class UnityProjectInspector:
     
     def list_prefabs(self) -> List[Dict[str, Any]]:
         """List all prefabs in the project"""
-        prefabs = []
-        
-        for prefab_file in self.assets_path.rglob("*.prefab"):
-            prefabs.append({
-                "name": prefab_file.stem,
-                "path": str(prefab_file.relative_to(self.project_root)),
-                "size": prefab_file.stat().st_size,
-                "folder": str(prefab_file.parent.relative_to(self.assets_path))
-            })
-        
-        return prefabs
+        return self._cached("prefabs", self._mtime_token(self.assets_path), self._list_prefabs, _LISTING_TTL)
+    
+    def _list_prefabs(self) -> List[Dict[str, Any]]:
+        """Scan Assets for prefabs"""
+        return self._describe_entries(self._scan((".prefab",)))
     
     def list_materials(self) -> List[Dict[str, Any]]:
         """List all materials in the project"""
-        materials = []
-        
-        for mat_file in self.assets_path.rglob("*.mat"):
-            materials.append({
-                "name": mat_file.stem,
-                "path": str(mat_file.relative_to(self.project_root)),
-                "size": mat_file.stat().st_size,
-                "folder": str(mat_file.parent.relative_to(self.assets_path))
-            })
-        
-        return materials
+        return self._cached("materials", self._mtime_token(self.assets_path), self._list_materials, _LISTING_TTL)
+    
+    def _list_materials(self) -> List[Dict[str, Any]]:
+        """Scan Assets for materials"""
+        return self._describe_entries(self._scan((".mat",)))
+    
+    def search_assets(self, search_term: str, asset_type: str = "") -> List[Dict[str, Any]]:
+        """Find assets whose name contains search_term in the cached asset index, best matches first"""
+        index = self._asset_index()
+        suffixes = _ASSET_SUFFIXES.get(asset_type) or _ALL_ASSET_SUFFIXES
+        
+        matches = []
+        for suffix in suffixes:
+            for name_lower, asset in index.get(suffix, ()):
+                if search_term in name_lower:
+                    # Sort by relevance (exact matches first, then partial), keyed once per match
+                    matches.append(((name_lower != search_term, name_lower), asset))
+        matches.sort(key=itemgetter(0))
+        return [match for _, match in matches]
+    
+    def _asset_index(self) -> Dict[str, List[Tuple[str, Dict[str, Any]]]]:
+        """Searchable assets grouped by suffix, so repeated searches scan memory instead of Assets"""
+        return self._cached("asset_index", self._mtime_token(self.assets_path), self._build_asset_index, _LISTING_TTL)
+    
+    def _build_asset_index(self) -> Dict[str, List[Tuple[str, Dict[str, Any]]]]:
+        """Walk Assets once for every searchable suffix, keeping each name lowercased for matching"""
+        root_len = len(self._root_prefix)
+        assets_len = len(self._assets_prefix)
+        dirname = os.path.dirname
+        
+        index: Dict[str, List[Tuple[str, Dict[str, Any]]]] = defaultdict(list)
+        for entry in self._scan(_ALL_ASSET_SUFFIXES):
+            stem, _, suffix = entry.name.rpartition('.')
+            index["." + suffix].append((stem.lower(), {
+                "name": stem,
+                "path": entry.path[root_len:],
+                "type": suffix,
+                "size": entry.stat().st_size,
+                "folder": dirname(entry.path)[assets_len:] or "."
+            }))
+        return index
     
     def get_project_structure(self) -> Dict[str, Any]:
         """Get complete project structure overview"""
+        return self._cached("structure", self._mtime_token(self.assets_path), self._build_project_structure, _LISTING_TTL)
+    
+    def _build_project_structure(self) -> Dict[str, Any]:
+        """Walk Assets once and summarise its contents"""
+        counts = Counter()
+        folders = []
+        
+        try:
+            with os.scandir(self.assets_path) as it:
+                for entry in it:
+                    if entry.name.startswith('.'):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        if not _is_pruned(entry.name):
+                            folders.append(entry)
+                    else:
+                        counts[entry.name.rpartition('.')[2].lower()] += 1
+        except OSError:
+            pass
+        
         structure = {
             "project_info": self.get_project_info(),
-            "assets": {
-                "scripts": len(list(self.assets_path.rglob("*.cs"))),
-                "scenes": len(list(self.assets_path.rglob("*.unity"))),
-                "prefabs": len(list(self.assets_path.rglob("*.prefab"))),
-                "materials": len(list(self.assets_path.rglob("*.mat"))),
-                "textures": len(list(self.assets_path.rglob("*.png"))) + len(list(self.assets_path.rglob("*.jpg"))),
-                "audio": len(list(self.assets_path.rglob("*.wav"))) + len(list(self.assets_path.rglob("*.mp3"))),
-            },
+            "assets": {},
             "folders": []
         }
         
-        # Get folder structure
-        for item in self.assets_path.iterdir():
-            if item.is_dir() and not item.name.startswith('.'):
-                folder_info = {
-                    "name": item.name,
-                    "path": str(item.relative_to(self.project_root)),
-                    "files": len([f for f in item.rglob("*") if f.is_file()]),
-                    "subfolders": len([f for f in item.rglob("*") if f.is_dir()])
-                }
-                structure["folders"].append(folder_info)
+        # Each top-level folder is walked once on the scan pool, yielding both its
+        # own file/subfolder totals and its share of the extension counts
+        root_len = len(self._root_prefix)
+        for folder, (extensions, files, subfolders) in zip(folders, _SCAN_POOL.map(_count_tree, [f.path for f in folders])):
+            counts.update(extensions)
+            structure["folders"].append({
+                "name": folder.name,
+                "path": folder.path[root_len:],
+                "files": files,
+                "subfolders": subfolders
+            })
+        
+        structure["assets"] = {
+            "scripts": counts["cs"],
+            "scenes": counts["unity"],
+            "prefabs": counts["prefab"],
+            "materials": counts["mat"],
+            "textures": counts["png"] + counts["jpg"],
+            "audio": counts["wav"] + counts["mp3"],
+        }
         
         return structure
 
@@ -370,385 +962,435 @@ def initialize_inspector():
     """Initialize the Unity project inspector"""
     global inspector
     
-    # Try to find Unity project root from current working directory
-    cwd = os.getcwd()
-    project_root = None
-    
-    # Check if we're already in a Unity project
-    if (Path(cwd) / "ProjectSettings").exists() and (Path(cwd) / "Assets").exists():
-        project_root = cwd
-    else:
-        # Try to find Unity project in parent directories
-        temp_inspector = UnityProjectInspector(cwd)
-        found_root = temp_inspector.find_unity_project_root(cwd)
-        if found_root:
-            project_root = str(found_root)
+    # Find the Unity project root from the current working directory or its parents
+    project_root = _find_project_root(os.getcwd())
     
     if project_root:
         inspector = UnityProjectInspector(project_root)
+        try:
+            inspector.ensure_command_dirs()
+        except OSError as e:
+            print(f"Warning: Could not create command folders: {e}", file=sys.stderr)
         return True
     
     return False
 
-@server.list_resources()
-async def handle_list_resources() -> List[Resource]:
-    """List available Unity project resources"""
-    if not inspector:
-        return []
-    
-    return [
-        Resource(
-            uri="unity://project-info",
-            name="Unity Project Information",
-            description="Basic Unity project information",
-            mimeType="application/json",
-        ),
-        Resource(
-            uri="unity://project-structure",
-            name="Unity Project Structure",
-            description="Complete project structure overview",
-            mimeType="application/json",
-        ),
-        Resource(
-            uri="unity://scripts",
-            name="Unity Scripts",
-            description="List of C# scripts in the project",
-            mimeType="application/json",
-        ),
-        Resource(
-            uri="unity://scenes",
-            name="Unity Scenes", 
-            description="List of scenes in the project",
-            mimeType="application/json",
-        ),
-        Resource(
-            uri="unity://prefabs",
-            name="Unity Prefabs",
-            description="List of prefabs in the project",
-            mimeType="application/json",
-        ),
-        Resource(
-            uri="unity://materials",
-            name="Unity Materials",
-            description="List of materials in the project",
-            mimeType="application/json",
-        ),
-    ]
-
-@server.read_resource()
-async def handle_read_resource(uri: str) -> str:
-    """Read Unity project resource content"""
-    if not inspector:
-        return json.dumps({"error": "Unity project not found"})
-    
-    try:
-        if uri == "unity://project-info":
-            return json.dumps(inspector.get_project_info(), indent=2)
-        elif uri == "unity://project-structure":
-            return json.dumps(inspector.get_project_structure(), indent=2)
-        elif uri == "unity://scripts":
-            return json.dumps(inspector.list_scripts(), indent=2)
-        elif uri == "unity://scenes":
-            return json.dumps(inspector.list_scenes(), indent=2)
-        elif uri == "unity://prefabs":
-            return json.dumps(inspector.list_prefabs(), indent=2)
-        elif uri == "unity://materials":
-            return json.dumps(inspector.list_materials(), indent=2)
-        else:
-            return json.dumps({"error": f"Unknown resource: {uri}"})
-    except Exception as e:
-        return json.dumps({"error": f"Failed to read resource {uri}: {str(e)}"})
+# Resource and tool descriptors never change while the server runs, so build them once
+_RESOURCES = [
+    Resource(
+        uri="unity://project-info",
+        name="Unity Project Information",
+        description="Basic Unity project information",
+        mimeType="application/json",
+    ),
+    Resource(
+        uri="unity://project-structure",
+        name="Unity Project Structure",
+        description="Complete project structure overview",
+        mimeType="application/json",
+    ),
+    Resource(
+        uri="unity://scripts",
+        name="Unity Scripts",
+        description="List of C# scripts in the project (supports ?offset=&limit= paging)",
+        mimeType="application/json",
+    ),
+    Resource(
+        uri="unity://scenes",
+        name="Unity Scenes", 
+        description="List of scenes in the project (supports ?offset=&limit= paging)",
+        mimeType="application/json",
+    ),
+    Resource(
+        uri="unity://prefabs",
+        name="Unity Prefabs",
+        description="List of prefabs in the project (supports ?offset=&limit= paging)",
+        mimeType="application/json",
+    ),
+    Resource(
+        uri="unity://materials",
+        name="Unity Materials",
+        description="List of materials in the project (supports ?offset=&limit= paging)",
+        mimeType="application/json",
+    ),
+]
 
-@server.list_tools()
-async def handle_list_tools() -> List[Tool]:
-    """List available Unity tools"""
-    return [
-        Tool(
-            name="unity_read_script",
-            description="Read the content of a Unity C# script",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "script_path": {
-                        "type": "string",
-                        "description": "Path to the script file (relative to project root)",
-                    },
+_TOOLS = [
+    Tool(
+        name="unity_read_script",
+        description="Read the content of a Unity C# script",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "script_path": {
+                    "type": "string",
+                    "description": "Path to the script file (relative to project root)",
                 },
-                "required": ["script_path"],
             },
-        ),
-        Tool(
-            name="unity_create_script",
-            description="Create a new C# script",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "script_name": {
-                        "type": "string",
-                        "description": "Name of the new script (without .cs extension)",
-                    },
-                    "folder_path": {
-                        "type": "string",
-                        "description": "Folder path relative to Assets (default: Scripts)",
-                    },
+            "required": ["script_path"],
+        },
+    ),
+    Tool(
+        name="unity_create_script",
+        description="Create a new C# script",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "script_name": {
+                    "type": "string",
+                    "description": "Name of the new script (without .cs extension)",
                 },
-                "required": ["script_name"],
-            },
-        ),
-        Tool(
-            name="unity_inspect_scene",
-            description="Inspect a Unity scene to see GameObjects, components, and hierarchy",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "scene_path": {
-                        "type": "string",
-                        "description": "Path to the scene file (relative to project root, e.g., 'Assets/Scenes/SampleScene.unity')",
-                    },
+                "folder_path": {
+                    "type": "string",
+                    "description": "Folder path relative to Assets (default: Scripts)",
                 },
-                "required": ["scene_path"],
             },
-        ),
-        Tool(
-            name="unity_list_gameobjects",
-            description="List all GameObjects in a specific scene with their components",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "scene_path": {
-                        "type": "string",
-                        "description": "Path to the scene file (relative to project root)",
-                    },
+            "required": ["script_name"],
+        },
+    ),
+    Tool(
+        name="unity_inspect_scene",
+        description="Inspect a Unity scene to see GameObjects, components, and hierarchy",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "scene_path": {
+                    "type": "string",
+                    "description": "Path to the scene file (relative to project root, e.g., 'Assets/Scenes/SampleScene.unity')",
                 },
-                "required": ["scene_path"],
-            },
-        ),
-        Tool(
-            name="unity_search_assets",
-            description="Search for assets by name or type in the project",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "search_term": {
-                        "type": "string",
-                        "description": "Term to search for in asset names",
-                    },
-                    "asset_type": {
-                        "type": "string",
-                        "description": "Asset type to filter by (script, scene, prefab, material, texture, audio)",
-                    },
+                "scene_paths": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Several scene paths to inspect in one call (used instead of scene_path)",
                 },
-                "required": ["search_term"],
-            },
-        ),
-        Tool(
-            name="unity_get_project_overview",
-            description="Get a comprehensive overview of the Unity project structure and contents",
-            inputSchema={
-                "type": "object",
-                "properties": {},
             },
-        ),
-        Tool(
-            name="unity_capture_screenshot",
-            description="Capture a screenshot of the Unity Scene View, Game View, or entire Unity Editor",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "view_type": {
-                        "type": "string",
-                        "description": "Type of view to capture: 'scene', 'game', or 'editor'",
-                        "enum": ["scene", "game", "editor"]
-                    },
-                    "delay_seconds": {
-                        "type": "number",
-                        "description": "Optional delay in seconds before capture (useful for arranging windows)",
-                    },
+        },
+    ),
+    Tool(
+        name="unity_list_gameobjects",
+        description="List all GameObjects in a specific scene with their components",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "scene_path": {
+                    "type": "string",
+                    "description": "Path to the scene file (relative to project root)",
                 },
-                "required": ["view_type"],
             },
-        ),
-        Tool(
-            name="unity_capture_camera_view",
-            description="Capture a screenshot from a specific camera's perspective",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "camera_name": {
-                        "type": "string",
-                        "description": "Name of the camera to capture from (e.g., 'Main Camera')",
-                    },
-                    "width": {
-                        "type": "number",
-                        "description": "Optional width for the screenshot (defaults to Game View resolution)",
-                    },
-                    "height": {
-                        "type": "number",
-                        "description": "Optional height for the screenshot (defaults to Game View resolution)",
-                    },
+            "required": ["scene_path"],
+        },
+    ),
+    Tool(
+        name="unity_search_assets",
+        description="Search for assets by name or type in the project",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "search_term": {
+                    "type": "string",
+                    "description": "Term to search for in asset names",
+                },
+                "asset_type": {
+                    "type": "string",
+                    "description": "Asset type to filter by (script, scene, prefab, material, texture, audio)",
                 },
-                "required": ["camera_name"],
             },
-        ),
-        Tool(
-            name="unity_get_scene_info",
-            description="Get detailed information about the current scene including GameObjects, cameras, and lighting",
-            inputSchema={
-                "type": "object",
-                "properties": {},
+            "required": ["search_term"],
+        },
+    ),
+    Tool(
+        name="unity_get_project_overview",
+        description="Get a comprehensive overview of the Unity project structure and contents",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+    Tool(
+        name="unity_capture_screenshot",
+        description="Capture a screenshot of the Unity Scene View, Game View, or entire Unity Editor",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "view_type": {
+                    "type": "string",
+                    "description": "Type of view to capture: 'scene', 'game', or 'editor'",
+                    "enum": ["scene", "game", "editor"]
+                },
+                "delay_seconds": {
+                    "type": "number",
+                    "description": "Optional delay in seconds before capture (useful for arranging windows)",
+                },
             },
-        ),
-        Tool(
-            name="unity_get_scene_hierarchy",
-            description="Get the exact hierarchy of GameObjects in the current scene with names and structure",
-            inputSchema={
-                "type": "object",
-                "properties": {},
+            "required": ["view_type"],
+        },
+    ),
+    Tool(
+        name="unity_capture_camera_view",
+        description="Capture a screenshot from a specific camera's perspective",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "camera_name": {
+                    "type": "string",
+                    "description": "Name of the camera to capture from (e.g., 'Main Camera')",
+                },
+                "width": {
+                    "type": "number",
+                    "description": "Optional width for the screenshot (defaults to Game View resolution)",
+                },
+                "height": {
+                    "type": "number",
+                    "description": "Optional height for the screenshot (defaults to Game View resolution)",
+                },
             },
-        ),
-        Tool(
-            name="unity_create_gameobject",
-            description="Create a new GameObject with optional parent",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Name of the new GameObject",
-                    },
-                    "parent": {
-                        "type": "string", 
-                        "description": "Optional parent GameObject name",
-                    },
+            "required": ["camera_name"],
+        },
+    ),
+    Tool(
+        name="unity_get_scene_info",
+        description="Get detailed information about the current scene including GameObjects, cameras, and lighting",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+    Tool(
+        name="unity_get_scene_hierarchy",
+        description="Get the exact hierarchy of GameObjects in the current scene with names and structure",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+    Tool(
+        name="unity_create_gameobject",
+        description="Create a new GameObject with optional parent",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Name of the new GameObject",
+                },
+                "parent": {
+                    "type": "string", 
+                    "description": "Optional parent GameObject name",
                 },
-                "required": ["name"],
             },
-        ),
-        Tool(
-            name="unity_delete_gameobject",
-            description="Delete a GameObject by name",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Name of the GameObject to delete",
-                    },
+            "required": ["name"],
+        },
+    ),
+    Tool(
+        name="unity_delete_gameobject",
+        description="Delete a GameObject by name",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Name of the GameObject to delete",
                 },
-                "required": ["name"],
             },
-        ),
-        Tool(
-            name="unity_set_property",
-            description="Set GameObject properties (position, rotation, scale, active, name, layer, tag)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "object_name": {
-                        "type": "string",
-                        "description": "Name of the GameObject",
-                    },
-                    "property": {
-                        "type": "string",
-                        "description": "Property to set: position, rotation, scale, active, name, layer, tag",
-                    },
-                    "value": {
-                        "type": "string",
-                        "description": "New value (e.g., '0,0,0' for vectors, 'true' for boolean, 'UI' for layer, 'Player' for tag)",
-                    },
+            "required": ["name"],
+        },
+    ),
+    Tool(
+        name="unity_set_property",
+        description="Set GameObject properties (position, rotation, scale, active, name, layer, tag)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Name of the GameObject",
+                },
+                "property": {
+                    "type": "string",
+                    "description": "Property to set: position, rotation, scale, active, name, layer, tag",
+                },
+                "value": {
+                    "type": "string",
+                    "description": "New value (e.g., '0,0,0' for vectors, 'true' for boolean, 'UI' for layer, 'Player' for tag)",
                 },
-                "required": ["object_name", "property", "value"],
             },
-        ),
-        Tool(
-            name="unity_add_component",
-            description="Add a component to a GameObject. Supports UI (Canvas, Image, Button, Text, Slider, etc.), Physics (Rigidbody, Collider, etc.), Rendering (Camera, Light, SpriteRenderer, etc.), Audio (AudioSource, AudioListener), and more.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "object_name": {
-                        "type": "string",
-                        "description": "Name of the GameObject",
-                    },
-                    "component_type": {
-                        "type": "string",
-                        "description": "Type of component to add. Examples: Canvas, RectTransform, Image, RawImage, Text, Button, Toggle, Slider, Dropdown, InputField, ScrollRect, Mask, CanvasScaler, GraphicRaycaster, CanvasGroup, LayoutElement, HorizontalLayoutGroup, VerticalLayoutGroup, GridLayoutGroup, Camera, Light, MeshRenderer, SpriteRenderer, ParticleSystem, Rigidbody, Rigidbody2D, BoxCollider, SphereCollider, BoxCollider2D, CircleCollider2D, AudioSource, AudioListener, Animator, Animation",
-                    },
+            "required": ["object_name", "property", "value"],
+        },
+    ),
+    Tool(
+        name="unity_add_component",
+        description="Add a component to a GameObject. Supports UI (Canvas, Image, Button, Text, Slider, etc.), Physics (Rigidbody, Collider, etc.), Rendering (Camera, Light, SpriteRenderer, etc.), Audio (AudioSource, AudioListener), and more.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Name of the GameObject",
+                },
+                "component_type": {
+                    "type": "string",
+                    "description": "Type of component to add. Examples: Canvas, RectTransform, Image, RawImage, Text, Button, Toggle, Slider, Dropdown, InputField, ScrollRect, Mask, CanvasScaler, GraphicRaycaster, CanvasGroup, LayoutElement, HorizontalLayoutGroup, VerticalLayoutGroup, GridLayoutGroup, Camera, Light, MeshRenderer, SpriteRenderer, ParticleSystem, Rigidbody, Rigidbody2D, BoxCollider, SphereCollider, BoxCollider2D, CircleCollider2D, AudioSource, AudioListener, Animator, Animation",
                 },
-                "required": ["object_name", "component_type"],
             },
-        ),
-        Tool(
-            name="unity_set_component_property",
-            description="Set component-specific properties for any Unity component. Supports Canvas (rendermode), RectTransform (anchormin, anchormax, sizedelta, anchoredposition), CanvasScaler (uiscalemode, referenceresolution, screenmatchmode, matchwidthorheight), Image (color, raycasttarget), Text (text, fontsize, color, alignment), Camera (fieldofview/fov, orthographic, orthographicsize, depth, backgroundcolor), Light (color, intensity, range), SpriteRenderer (color, flipx, flipy, sortingorder), Rigidbody (mass, drag, angulardrag, usegravity, iskinematic), Rigidbody2D (mass, drag, angulardrag, gravityscale, iskinematic), AudioSource (volume, pitch, loop, playonawake), Collider (istrigger), CanvasGroup (alpha, interactable, blocksraycasts)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "object_name": {
-                        "type": "string",
-                        "description": "Name of the GameObject",
-                    },
-                    "component_type": {
-                        "type": "string",
-                        "description": "Type of component (Canvas, RectTransform, CanvasScaler, Image, Text, Camera, Light, SpriteRenderer, Rigidbody, Rigidbody2D, AudioSource, Collider, CanvasGroup, etc.)",
-                    },
-                    "property": {
-                        "type": "string",
-                        "description": "Property name to set (depends on component type - see description for full list)",
-                    },
-                    "value": {
-                        "type": "string",
-                        "description": "Property value. Format depends on property type: vectors as 'x,y' or 'x,y,z', colors as 'r,g,b' or 'r,g,b,a' (0-1 range), booleans as 'true'/'false', numbers as strings",
-                    },
+            "required": ["object_name", "component_type"],
+        },
+    ),
+    Tool(
+        name="unity_set_component_property",
+        description="Set component-specific properties for any Unity component. Supports Canvas (rendermode), RectTransform (anchormin, anchormax, sizedelta, anchoredposition), CanvasScaler (uiscalemode, referenceresolution, screenmatchmode, matchwidthorheight), Image (color, raycasttarget), Text (text, fontsize, color, alignment), Camera (fieldofview/fov, orthographic, orthographicsize, depth, backgroundcolor), Light (color, intensity, range), SpriteRenderer (color, flipx, flipy, sortingorder), Rigidbody (mass, drag, angulardrag, usegravity, iskinematic), Rigidbody2D (mass, drag, angulardrag, gravityscale, iskinematic), AudioSource (volume, pitch, loop, playonawake), Collider (istrigger), CanvasGroup (alpha, interactable, blocksraycasts)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Name of the GameObject",
+                },
+                "component_type": {
+                    "type": "string",
+                    "description": "Type of component (Canvas, RectTransform, CanvasScaler, Image, Text, Camera, Light, SpriteRenderer, Rigidbody, Rigidbody2D, AudioSource, Collider, CanvasGroup, etc.)",
+                },
+                "property": {
+                    "type": "string",
+                    "description": "Property name to set (depends on component type - see description for full list)",
+                },
+                "value": {
+                    "type": "string",
+                    "description": "Property value. Format depends on property type: vectors as 'x,y' or 'x,y,z', colors as 'r,g,b' or 'r,g,b,a' (0-1 range), booleans as 'true'/'false', numbers as strings",
                 },
-                "required": ["object_name", "component_type", "property", "value"],
             },
-        ),
-        Tool(
-            name="unity_remove_component",
-            description="Remove a component from a GameObject",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "object_name": {
-                        "type": "string",
-                        "description": "Name of the GameObject",
-                    },
-                    "component_type": {
-                        "type": "string",
-                        "description": "Type of component to remove (same types as add_component)",
-                    },
+            "required": ["object_name", "component_type", "property", "value"],
+        },
+    ),
+    Tool(
+        name="unity_remove_component",
+        description="Remove a component from a GameObject",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Name of the GameObject",
+                },
+                "component_type": {
+                    "type": "string",
+                    "description": "Type of component to remove (same types as add_component)",
                 },
-                "required": ["object_name", "component_type"],
             },
-        ),
-        Tool(
-            name="unity_cleanup_screenshots",
-            description="Clean up old screenshots to save disk space",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "keep_count": {
-                        "type": "number",
-                        "description": "Number of recent screenshots to keep (default: 5)",
-                    },
+            "required": ["object_name", "component_type"],
+        },
+    ),
+    Tool(
+        name="unity_cleanup_screenshots",
+        description="Clean up old screenshots to save disk space",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "keep_count": {
+                    "type": "number",
+                    "description": "Number of recent screenshots to keep (default: 5)",
                 },
             },
-        ),
-        Tool(
-            name="unity_force_refresh",
-            description="Force Unity to refresh and recompile immediately",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "reason": {
-                        "type": "string",
-                        "description": "Optional reason for the refresh",
-                    },
+        },
+    ),
+    Tool(
+        name="unity_force_refresh",
+        description="Force Unity to refresh and recompile immediately",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "reason": {
+                    "type": "string",
+                    "description": "Optional reason for the refresh",
                 },
             },
-        ),
-    ]
+        },
+    ),
+]
+
+@server.list_resources()
+async def handle_list_resources() -> List[Resource]:
+    """List available Unity project resources"""
+    if not inspector:
+        return []
+    
+    return _RESOURCES
+
+# Serialized resource payloads, reused while the inspector hands back the same cached object
+_resource_json: Dict[str, Tuple[Any, str]] = {}
+
+def _resource_text(uri: str, data: Any, query: str = "") -> str:
+    """Serialize a resource payload, skipping json.dumps on cache hits"""
+    if query:
+        return _dumps(_page(data, query))
+    
+    cached = _resource_json.get(uri)
+    if cached is not None and cached[0] is data:
+        return cached[1]
+    
+    text = _dumps(data)
+    _resource_json[uri] = (data, text)
+    return text
+
+# Serialized tool responses, keyed per tool and scene, reused while the underlying
+# cached payload is the same object; bounded like the scene cache it mirrors
+_tool_json: "OrderedDict[str, Tuple[Any, str]]" = OrderedDict()
+
+def _tool_text(key: str, data: Any, build=None) -> str:
+    """Serialize a tool payload (optionally reshaped by build), skipping the work on cache hits"""
+    cached = _tool_json.get(key)
+    if cached is not None and cached[0] is data:
+        _tool_json.move_to_end(key)
+        return cached[1]
+    
+    text = _dumps(build(data) if build else data)
+    _tool_json[key] = (data, text)
+    if len(_tool_json) > _SCENE_CACHE_SIZE:
+        _tool_json.popitem(last=False)
+    return text
+
+def _page(items: List[Any], query: str) -> List[Any]:
+    """Apply ?offset=&limit= query parameters to a listing"""
+    params = parse_qs(query)
+    offset = max(int(params.get("offset", ["0"])[0]), 0)
+    limit = params.get("limit")
+    if limit is None:
+        return items[offset:]
+    return items[offset:offset + max(int(limit[0]), 0)]
+
+@server.read_resource()
+async def handle_read_resource(uri: str) -> str:
+    """Read Unity project resource content"""
+    if not inspector:
+        return _dumps({"error": "Unity project not found"})
+    
+    # Listing resources accept an optional query, e.g. unity://scripts?offset=0&limit=500
+    parts = urlsplit(str(uri))
+    query = parts.query
+    uri = f"{parts.scheme}://{parts.netloc}{parts.path}"
+    
+    try:
+        # File reads and directory walks all run off the event loop
+        if uri == "unity://project-info":
+            return _resource_text(uri, await _run_blocking(inspector.get_project_info))
+        elif uri == "unity://project-structure":
+            return _resource_text(uri, await _run_blocking(inspector.get_project_structure))
+        elif uri == "unity://scripts":
+            return _resource_text(uri, await _run_blocking(inspector.list_scripts), query)
+        elif uri == "unity://scenes":
+            return _resource_text(uri, await _run_blocking(inspector.list_scenes), query)
+        elif uri == "unity://prefabs":
+            return _resource_text(uri, await _run_blocking(inspector.list_prefabs), query)
+        elif uri == "unity://materials":
+            return _resource_text(uri, await _run_blocking(inspector.list_materials), query)
+        else:
+            return _dumps({"error": f"Unknown resource: {uri}"})
+    except Exception as e:
+        return _dumps({"error": f"Failed to read resource {uri}: {str(e)}"})
+
+@server.list_tools()
+async def handle_list_tools() -> List[Tool]:
+    """List available Unity tools"""
+    return _TOOLS
 
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
@@ -756,45 +1398,12 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextCon
     if not inspector:
         return [TextContent(type="text", text="Unity project not found")]
     
+    handler = _DISPATCH.get(name)
+    if handler is None:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+    
     try:
-        if name == "unity_read_script":
-            return await read_script(arguments)
-        elif name == "unity_create_script":
-            return await create_script(arguments)
-        elif name == "unity_inspect_scene":
-            return await inspect_scene(arguments)
-        elif name == "unity_list_gameobjects":
-            return await list_gameobjects(arguments)
-        elif name == "unity_search_assets":
-            return await search_assets(arguments)
-        elif name == "unity_get_project_overview":
-            return await get_project_overview(arguments)
-        elif name == "unity_capture_screenshot":
-            return await capture_screenshot(arguments)
-        elif name == "unity_capture_camera_view":
-            return await capture_camera_view(arguments)
-        elif name == "unity_get_scene_info":
-            return await get_scene_info(arguments)
-        elif name == "unity_get_scene_hierarchy":
-            return await get_scene_hierarchy(arguments)
-        elif name == "unity_create_gameobject":
-            return await create_gameobject(arguments)
-        elif name == "unity_delete_gameobject":
-            return await delete_gameobject(arguments)
-        elif name == "unity_set_property":
-            return await set_property(arguments)
-        elif name == "unity_add_component":
-            return await add_component(arguments)
-        elif name == "unity_remove_component":
-            return await remove_component(arguments)
-        elif name == "unity_set_component_property":
-            return await set_component_property(arguments)
-        elif name == "unity_cleanup_screenshots":
-            return await cleanup_screenshots(arguments)
-        elif name == "unity_force_refresh":
-            return await force_refresh(arguments)
-        else:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
+        return await handler(arguments)
     except Exception as e:
         return [TextContent(type="text", text=f"Error executing tool {name}: {str(e)}")]
 
@@ -807,11 +1416,15 @@ async def read_script(args: Dict[str, Any]) -> List[TextContent]:
     full_path = inspector.project_root / script_path
     
     try:
-        if not full_path.exists():
-            return [TextContent(type="text", text=f"Script not found: {script_path}")]
+        size, data = await asyncio.to_thread(_read_capped, full_path, _MAX_SCRIPT_BYTES)
+        if data is None:
+            return [TextContent(type="text", text=f"Script too large: {size} bytes (limit {_MAX_SCRIPT_BYTES})")]
         
-        content = full_path.read_text(encoding='utf-8')
-        return [TextContent(type="text", text=content)]
+        # Decoded once at the TextContent boundary; Unity's Windows scripts carry a BOM and CRLF endings
+        return [TextContent(type="text", text=data.decode('utf-8-sig').replace('\r\n', '\n'))]
+    
+    except FileNotFoundError:
+        return [TextContent(type="text", text=f"Script not found: {script_path}")]
     
     except Exception as e:
         return [TextContent(type="text", text=f"Error reading script: {str(e)}")]
@@ -825,49 +1438,36 @@ async def create_script(args: Dict[str, Any]) -> List[TextContent]:
         return [TextContent(type="text", text="script_name is required")]
     
     # Ensure script name is valid
-    script_name = re.sub(r'[^a-zA-Z0-9_]', '', script_name)
+    script_name = _SCRIPT_NAME_RE.sub('', script_name)
     if not script_name or script_name[0].isdigit():
         return [TextContent(type="text", text="Invalid script name")]
     
     # Create target directory
     target_dir = inspector.assets_path / folder_path
-    target_dir.mkdir(parents=True, exist_ok=True)
+    await asyncio.to_thread(target_dir.mkdir, parents=True, exist_ok=True)
     
     script_file = target_dir / f"{script_name}.cs"
     
-    if script_file.exists():
-        return [TextContent(type="text", text=f"Script already exists: {script_file.relative_to(inspector.project_root)}")]
-    
-    # Simple MonoBehaviour template
-    script_content = f"""using UnityEngine;
-
-public class {script_name} : MonoBehaviour
-{{
-    void Start()
-    {{
-        
-    }}
-    
-    void Update()
-    {{
-        
-    }}
-}}"""
+    # The sanitized name is plain ASCII, so the template never goes through a text codec
+    script_content = _SCRIPT_TEMPLATE_HEAD + script_name.encode('ascii') + _SCRIPT_TEMPLATE_TAIL
     
     try:
-        script_file.write_text(script_content, encoding='utf-8')
+        # One exclusive create both checks for an existing script and writes the new one
+        if not await asyncio.to_thread(_create_exclusive, script_file, script_content):
+            return [TextContent(type="text", text=f"Script already exists: {inspector.relative_path(script_file)}")]
+        inspector.invalidate_cache()
         
-        # Force Unity refresh immediately after creating script
-        await force_refresh({"reason": f"Created script: {script_name}"})
+        # Force Unity refresh right away, without holding the response for it
+        _spawn(force_refresh({"reason": f"Created script: {script_name}"}))
         
         result = {
             "success": True,
-            "script_path": str(script_file.relative_to(inspector.project_root)),
-            "lines": len(script_content.split('\n')),
+            "script_path": inspector.relative_path(script_file),
+            "lines": _SCRIPT_TEMPLATE_LINES,
             "auto_refresh": "forced"
         }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [TextContent(type="text", text=_dumps(result))]
         
     except Exception as e:
         return [TextContent(type="text", text=f"Error creating script: {str(e)}")]
@@ -875,15 +1475,38 @@ public class {script_name} : MonoBehaviour
 async def inspect_scene(args: Dict[str, Any]) -> List[TextContent]:
     """Inspect a Unity scene to see GameObjects and components"""
     scene_path = args.get("scene_path")
-    if not scene_path:
-        return [TextContent(type="text", text="scene_path is required")]
+    scene_paths = args.get("scene_paths")
+    if not scene_path and not scene_paths:
+        return [TextContent(type="text", text="scene_path or scene_paths is required")]
     
     try:
-        scene_data = inspector.get_scene_hierarchy(scene_path)
-        return [TextContent(type="text", text=json.dumps(scene_data, indent=2))]
+        if scene_paths:
+            # Each scene is read and parsed as its own pool job, so reads overlap with parses
+            scene_data = await asyncio.gather(*(_run_blocking(inspector.get_scene_hierarchy, path) for path in scene_paths))
+            return [TextContent(type="text", text=_dumps(scene_data))]
+        
+        scene_data = await _run_blocking(inspector.get_scene_hierarchy, scene_path)
+        return [TextContent(type="text", text=_tool_text(f"inspect_scene:{scene_path}", scene_data))]
     except Exception as e:
         return [TextContent(type="text", text=f"Error inspecting scene: {str(e)}")]
 
+def _summarize_gameobjects(scene_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Simplified GameObject view of a parsed scene for unity_list_gameobjects"""
+    # Create simplified GameObject list; parsed GameObjects always carry these keys
+    gameobjects_summary = [{
+        "name": go["name"],
+        "active": go["active"],
+        "components": [comp["type"] for comp in go["components"]],
+        "position": go["transform"]["position"] if "transform" in go else None
+    } for go in scene_data.get("gameObjects") or ()]
+    
+    return {
+        "scene": scene_data.get("name", "Unknown"),
+        "path": scene_data.get("path", ""),
+        "gameObjects": gameobjects_summary,
+        "summary": scene_data.get("summary", {})
+    }
+
 async def list_gameobjects(args: Dict[str, Any]) -> List[TextContent]:
     """List GameObjects in a scene with simplified view"""
     scene_path = args.get("scene_path")
@@ -891,30 +1514,13 @@ async def list_gameobjects(args: Dict[str, Any]) -> List[TextContent]:
         return [TextContent(type="text", text="scene_path is required")]
     
     try:
-        scene_data = inspector.get_scene_hierarchy(scene_path)
-        
-        if "error" in scene_data:
-            return [TextContent(type="text", text=json.dumps(scene_data, indent=2))]
-        
-        # Create simplified GameObject list
-        gameobjects_summary = []
-        for go in scene_data.get("gameObjects", []):
-            go_summary = {
-                "name": go.get("name", "Unknown"),
-                "active": go.get("active", True),
-                "components": [comp.get("type", "Unknown") for comp in go.get("components", [])],
-                "position": go.get("transform", {}).get("position", {"x": 0, "y": 0, "z": 0}) if go.get("transform") else None
-            }
-            gameobjects_summary.append(go_summary)
+        scene_data = await _run_blocking(inspector.get_scene_hierarchy, scene_path)
         
-        result = {
-            "scene": scene_data.get("name", "Unknown"),
-            "path": scene_data.get("path", ""),
-            "gameObjects": gameobjects_summary,
-            "summary": scene_data.get("summary", {})
-        }
+        # Parsed scenes always carry an "error" key; only a set one is a failure
+        if scene_data.get("error") or "gameObjects" not in scene_data:
+            return [TextContent(type="text", text=_dumps(scene_data))]
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [TextContent(type="text", text=_tool_text(f"list_gameobjects:{scene_path}", scene_data, _summarize_gameobjects))]
         
     except Exception as e:
         return [TextContent(type="text", text=f"Error listing GameObjects: {str(e)}")]
@@ -925,49 +1531,11 @@ async def search_assets(args: Dict[str, Any]) -> List[TextContent]:
     asset_type = args.get("asset_type", "").lower()
     
     try:
-        results = {"matches": [], "search_term": search_term, "asset_type": asset_type}
-        
-        # Define search patterns based on asset type
-        patterns = {
-            "script": "*.cs",
-            "scene": "*.unity", 
-            "prefab": "*.prefab",
-            "material": "*.mat",
-            "texture": ["*.png", "*.jpg", "*.jpeg", "*.tga"],
-            "audio": ["*.wav", "*.mp3", "*.ogg"]
-        }
+        # Served from the inspector's asset index, rebuilt only when Assets changes
+        matches = await _run_blocking(inspector.search_assets, search_term, asset_type)
+        results = {"matches": matches, "search_term": search_term, "asset_type": asset_type}
         
-        # Search in appropriate file types
-        if asset_type and asset_type in patterns:
-            pattern_list = patterns[asset_type] if isinstance(patterns[asset_type], list) else [patterns[asset_type]]
-        else:
-            # Search all types
-            pattern_list = []
-            for p in patterns.values():
-                if isinstance(p, list):
-                    pattern_list.extend(p)
-                else:
-                    pattern_list.append(p)
-        
-        # Perform search
-        for pattern in pattern_list:
-            for file_path in inspector.assets_path.rglob(pattern):
-                if search_term in file_path.stem.lower():
-                    results["matches"].append({
-                        "name": file_path.stem,
-                        "path": str(file_path.relative_to(inspector.project_root)),
-                        "type": file_path.suffix[1:],  # Remove the dot
-                        "size": file_path.stat().st_size,
-                        "folder": str(file_path.parent.relative_to(inspector.assets_path))
-                    })
-        
-        # Sort by relevance (exact matches first, then partial)
-        results["matches"].sort(key=lambda x: (
-            0 if search_term == x["name"].lower() else 1,
-            x["name"].lower()
-        ))
-        
-        return [TextContent(type="text", text=json.dumps(results, indent=2))]
+        return [TextContent(type="text", text=_dumps(results))]
         
     except Exception as e:
         return [TextContent(type="text", text=f"Error searching assets: {str(e)}")]
@@ -975,8 +1543,8 @@ async def search_assets(args: Dict[str, Any]) -> List[TextContent]:
 async def get_project_overview(args: Dict[str, Any]) -> List[TextContent]:
     """Get comprehensive project overview"""
     try:
-        overview = inspector.get_project_structure()
-        return [TextContent(type="text", text=json.dumps(overview, indent=2))]
+        overview = await _run_blocking(inspector.get_project_structure)
+        return [TextContent(type="text", text=_tool_text("project_overview", overview))]
     except Exception as e:
         return [TextContent(type="text", text=f"Error getting project overview: {str(e)}")]
 
@@ -985,17 +1553,6 @@ async def capture_screenshot(args: Dict[str, Any]) -> List[TextContent]:
     view_type = args.get("view_type", "scene")
     
     try:
-        # Create command file for Unity to process
-        command_dir = inspector.project_root / "Temp" / "KiroCommands"
-        command_dir.mkdir(parents=True, exist_ok=True)
-        
-        command_file = command_dir / "command.txt"
-        result_file = command_dir / "result.txt"
-        
-        # Remove old result file
-        if result_file.exists():
-            result_file.unlink()
-        
         # Write command with optional delay
         delay_seconds = args.get("delay_seconds", 0)
         
@@ -1012,34 +1569,27 @@ async def capture_screenshot(args: Dict[str, Any]) -> List[TextContent]:
         if delay_seconds > 0:
             command += f"|{int(delay_seconds)}"
         
-        command_file.write_text(command)
-        
         # Wait for Unity to process the command
-        import time
-        for i in range(10):  # Wait up to 5 seconds
-            time.sleep(0.5)
-            if result_file.exists():
-                result_text = result_file.read_text().strip()
-                result_file.unlink()  # Clean up
-                
-                if result_text != "Failed":
-                    result = {
-                        "success": True,
-                        "action": "capture_screenshot",
-                        "view_type": view_type,
-                        "screenshot_path": result_text.replace(str(inspector.project_root) + "\\", "").replace("\\", "/"),
-                        "timestamp": datetime.now().isoformat()
-                    }
-                else:
-                    result = {
-                        "success": False,
-                        "action": "capture_screenshot",
-                        "view_type": view_type,
-                        "error": "Screenshot capture failed",
-                        "timestamp": datetime.now().isoformat()
-                    }
-                
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        result_text = await _send_command(command)
+        if result_text is not None:
+            if result_text != "Failed":
+                result = {
+                    "success": True,
+                    "action": "capture_screenshot",
+                    "view_type": view_type,
+                    "screenshot_path": inspector.relative_unity_path(result_text),
+                    "timestamp": datetime.now().isoformat()
+                }
+            else:
+                result = {
+                    "success": False,
+                    "action": "capture_screenshot",
+                    "view_type": view_type,
+                    "error": "Screenshot capture failed",
+                    "timestamp": datetime.now().isoformat()
+                }
+            
+            return [TextContent(type="text", text=_dumps(result))]
         
         # Timeout
         result = {
@@ -1050,7 +1600,7 @@ async def capture_screenshot(args: Dict[str, Any]) -> List[TextContent]:
             "timestamp": datetime.now().isoformat()
         }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [TextContent(type="text", text=_dumps(result))]
         
     except Exception as e:
         return [TextContent(type="text", text=f"Error capturing screenshot: {str(e)}")]
@@ -1062,47 +1612,29 @@ async def capture_camera_view(args: Dict[str, Any]) -> List[TextContent]:
     height = args.get("height", 0)
     
     try:
-        # Create command file for Unity to process
-        command_dir = inspector.project_root / "Temp" / "KiroCommands"
-        command_dir.mkdir(parents=True, exist_ok=True)
-        
-        command_file = command_dir / "command.txt"
-        result_file = command_dir / "result.txt"
-        
-        # Remove old result file
-        if result_file.exists():
-            result_file.unlink()
-        
         # Write command with optional resolution
         command = f"capture_camera|{camera_name}|{int(width)}|{int(height)}"
-        command_file.write_text(command)
-        
         # Wait for Unity to process the command
-        import time
-        for i in range(10):  # Wait up to 5 seconds
-            time.sleep(0.5)
-            if result_file.exists():
-                result_text = result_file.read_text().strip()
-                result_file.unlink()  # Clean up
-                
-                if result_text not in ["Failed", "Camera not found"]:
-                    result = {
-                        "success": True,
-                        "action": "capture_camera_view",
-                        "camera_name": camera_name,
-                        "screenshot_path": result_text.replace(str(inspector.project_root) + "\\", "").replace("\\", "/"),
-                        "timestamp": datetime.now().isoformat()
-                    }
-                else:
-                    result = {
-                        "success": False,
-                        "action": "capture_camera_view",
-                        "camera_name": camera_name,
-                        "error": result_text,
-                        "timestamp": datetime.now().isoformat()
-                    }
-                
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        result_text = await _send_command(command)
+        if result_text is not None:
+            if result_text not in ["Failed", "Camera not found"]:
+                result = {
+                    "success": True,
+                    "action": "capture_camera_view",
+                    "camera_name": camera_name,
+                    "screenshot_path": inspector.relative_unity_path(result_text),
+                    "timestamp": datetime.now().isoformat()
+                }
+            else:
+                result = {
+                    "success": False,
+                    "action": "capture_camera_view",
+                    "camera_name": camera_name,
+                    "error": result_text,
+                    "timestamp": datetime.now().isoformat()
+                }
+            
+            return [TextContent(type="text", text=_dumps(result))]
         
         # Timeout
         result = {
@@ -1113,7 +1645,7 @@ async def capture_camera_view(args: Dict[str, Any]) -> List[TextContent]:
             "timestamp": datetime.now().isoformat()
         }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [TextContent(type="text", text=_dumps(result))]
         
     except Exception as e:
         return [TextContent(type="text", text=f"Error capturing camera view: {str(e)}")]
@@ -1121,134 +1653,25 @@ async def capture_camera_view(args: Dict[str, Any]) -> List[TextContent]:
 async def get_scene_info(args: Dict[str, Any]) -> List[TextContent]:
     """Get detailed scene information from Unity"""
     try:
-        # Create a trigger script that will export scene info
-        trigger_file = inspector.project_root / "Temp" / "kiro_scene_info_trigger.cs"
-        trigger_content = f"""// KIRO SCENE INFO TRIGGER - {datetime.now()}
-using UnityEngine;
-using UnityEditor;
-using System.IO;
-using System;
-using System.Collections.Generic;
-
-[InitializeOnLoad]
-public class KiroSceneInfoTrigger_{int(datetime.now().timestamp())}
-{{
-    static KiroSceneInfoTrigger_{int(datetime.now().timestamp())}()
-    {{
-        EditorApplication.delayCall += () => {{
-            SaveSceneInfoToFile();
-            
-            // Clean up this trigger file
-            string thisFile = "Temp/kiro_scene_info_trigger.cs";
-            if (File.Exists(thisFile))
-            {{
-                File.Delete(thisFile);
-            }}
-        }};
-    }}
-    
-    static void SaveSceneInfoToFile()
-    {{
-        try
-        {{
-            string directory = "Temp/KiroSceneInfo";
-            Directory.CreateDirectory(directory);
-            
-            var scene = UnityEngine.SceneManagement.SceneManager.GetActiveScene();
-            var sceneInfo = new Dictionary<string, object>();
-            
-            sceneInfo["sceneName"] = scene.name;
-            sceneInfo["scenePath"] = scene.path;
-            sceneInfo["timestamp"] = DateTime.Now.ToString("yyyy-MM-dd HH:mm:ss");
-            
-            // Get GameObjects
-            var gameObjects = new List<Dictionary<string, object>>();
-            GameObject[] allObjects = GameObject.FindObjectsOfType<GameObject>();
-            
-            foreach (GameObject go in allObjects)
-            {{
-                if (go.transform.parent == null) // Only root objects
-                {{
-                    var goInfo = new Dictionary<string, object>();
-                    goInfo["name"] = go.name;
-                    goInfo["isActive"] = go.activeInHierarchy;
-                    goInfo["position"] = go.transform.position.ToString();
-                    goInfo["rotation"] = go.transform.rotation.eulerAngles.ToString();
-                    goInfo["scale"] = go.transform.localScale.ToString();
-                    goInfo["tag"] = go.tag;
-                    goInfo["layer"] = LayerMask.LayerToName(go.layer);
-                    
-                    var components = new List<string>();
-                    Component[] comps = go.GetComponents<Component>();
-                    foreach (Component comp in comps)
-                    {{
-                        if (comp != null)
-                            components.Add(comp.GetType().Name);
-                    }}
-                    goInfo["components"] = components;
-                    
-                    gameObjects.Add(goInfo);
-                }}
-            }}
-            sceneInfo["gameObjects"] = gameObjects;
-            
-            // Get cameras
-            var cameras = new List<Dictionary<string, object>>();
-            Camera[] cams = GameObject.FindObjectsOfType<Camera>();
-            foreach (Camera cam in cams)
-            {{
-                var camInfo = new Dictionary<string, object>();
-                camInfo["name"] = cam.name;
-                camInfo["position"] = cam.transform.position.ToString();
-                camInfo["rotation"] = cam.transform.rotation.eulerAngles.ToString();
-                camInfo["fieldOfView"] = cam.fieldOfView;
-                camInfo["isOrthographic"] = cam.orthographic;
-                camInfo["isMainCamera"] = cam.CompareTag("MainCamera");
-                cameras.Add(camInfo);
-            }}
-            sceneInfo["cameras"] = cameras;
-            
-            string json = JsonUtility.ToJson(sceneInfo, true);
-            string filename = $"scene_{{scene.name}}_{{DateTime.Now:yyyyMMdd_HHmmss}}.json";
-            string fullPath = Path.Combine(directory, filename);
-            
-            File.WriteAllText(fullPath, json);
-            Debug.Log($"Kiro: Scene info saved to {{fullPath}}");
-        }}
-        catch (Exception e)
-        {{
-            Debug.LogError($"Kiro: Failed to save scene info: {{e.Message}}");
-        }}
-    }}
-}}"""
-        
-        trigger_file.write_text(trigger_content, encoding='utf-8')
-        
-        # Wait a moment for Unity to process
-        import time
-        time.sleep(2)
-        
-        # Try to read the generated scene info
-        scene_info_dir = inspector.project_root / "Temp" / "KiroSceneInfo"
-        if scene_info_dir.exists():
-            json_files = list(scene_info_dir.glob("*.json"))
-            if json_files:
-                latest_info = max(json_files, key=lambda p: p.stat().st_mtime)
-                try:
-                    scene_data = json.loads(latest_info.read_text())
-                    return [TextContent(type="text", text=json.dumps(scene_data, indent=2))]
-                except Exception as e:
-                    pass
-        
-        # If no scene info found, return basic info
+        # KiroCommandProcessor answers with the serialized UnitySceneInspector.SceneInfo
+        result_text = await _send_command("get_scene_info")
+        if result_text is not None:
+            try:
+                scene_data = json.loads(result_text)
+                return [TextContent(type="text", text=_dumps(scene_data))]
+            except json.JSONDecodeError:
+                # If not JSON, return as text
+                return [TextContent(type="text", text=result_text)]
+        
+        # Timeout
         result = {
-            "success": True,
+            "success": False,
             "action": "get_scene_info",
-            "message": "Scene info export initiated - check Temp/KiroSceneInfo folder",
+            "error": "Timeout waiting for Unity to process command",
             "timestamp": datetime.now().isoformat()
         }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [TextContent(type="text", text=_dumps(result))]
         
     except Exception as e:
         return [TextContent(type="text", text=f"Error getting scene info: {str(e)}")]
@@ -1256,36 +1679,18 @@ public class KiroSceneInfoTrigger_{int(datetime.now().timestamp())}
 async def get_scene_hierarchy(args: Dict[str, Any]) -> List[TextContent]:
     """Get the exact hierarchy of GameObjects in the current scene"""
     try:
-        # Create command file for Unity to process
-        command_dir = inspector.project_root / "Temp" / "KiroCommands"
-        command_dir.mkdir(parents=True, exist_ok=True)
-        
-        command_file = command_dir / "command.txt"
-        result_file = command_dir / "result.txt"
-        
-        # Remove old result file
-        if result_file.exists():
-            result_file.unlink()
-        
         # Write command
         command = "get_hierarchy"
-        command_file.write_text(command)
-        
         # Wait for Unity to process the command
-        import time
-        for i in range(10):  # Wait up to 5 seconds
-            time.sleep(0.5)
-            if result_file.exists():
-                result_text = result_file.read_text().strip()
-                result_file.unlink()  # Clean up
-                
-                try:
-                    # Try to parse as JSON
-                    hierarchy_data = json.loads(result_text)
-                    return [TextContent(type="text", text=json.dumps(hierarchy_data, indent=2))]
-                except json.JSONDecodeError:
-                    # If not JSON, return as text
-                    return [TextContent(type="text", text=result_text)]
+        result_text = await _send_command(command)
+        if result_text is not None:
+            try:
+                # Try to parse as JSON
+                hierarchy_data = json.loads(result_text)
+                return [TextContent(type="text", text=_dumps(hierarchy_data))]
+            except json.JSONDecodeError:
+                # If not JSON, return as text
+                return [TextContent(type="text", text=result_text)]
         
         # Timeout
         result = {
@@ -1295,7 +1700,7 @@ async def get_scene_hierarchy(args: Dict[str, Any]) -> List[TextContent]:
             "timestamp": datetime.now().isoformat()
         }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [TextContent(type="text", text=_dumps(result))]
         
     except Exception as e:
         return [TextContent(type="text", text=f"Error getting scene hierarchy: {str(e)}")]
@@ -1306,25 +1711,10 @@ async def create_gameobject(args: Dict[str, Any]) -> List[TextContent]:
     parent = args.get("parent", "")
     
     try:
-        command_dir = inspector.project_root / "Temp" / "KiroCommands"
-        command_dir.mkdir(parents=True, exist_ok=True)
-        
-        command_file = command_dir / "command.txt"
-        result_file = command_dir / "result.txt"
-        
-        if result_file.exists():
-            result_file.unlink()
-        
         command = f"create_gameobject|{name}|{parent}"
-        command_file.write_text(command)
-        
-        import time
-        for i in range(10):
-            time.sleep(0.5)
-            if result_file.exists():
-                result_text = result_file.read_text().strip()
-                result_file.unlink()
-                return [TextContent(type="text", text=result_text)]
+        result_text = await _send_command(command)
+        if result_text is not None:
+            return [TextContent(type="text", text=result_text)]
         
         return [TextContent(type="text", text="Timeout waiting for Unity")]
         
@@ -1336,25 +1726,10 @@ async def delete_gameobject(args: Dict[str, Any]) -> List[TextContent]:
     name = args.get("name", "")
     
     try:
-        command_dir = inspector.project_root / "Temp" / "KiroCommands"
-        command_dir.mkdir(parents=True, exist_ok=True)
-        
-        command_file = command_dir / "command.txt"
-        result_file = command_dir / "result.txt"
-        
-        if result_file.exists():
-            result_file.unlink()
-        
         command = f"delete_gameobject|{name}"
-        command_file.write_text(command)
-        
-        import time
-        for i in range(10):
-            time.sleep(0.5)
-            if result_file.exists():
-                result_text = result_file.read_text().strip()
-                result_file.unlink()
-                return [TextContent(type="text", text=result_text)]
+        result_text = await _send_command(command)
+        if result_text is not None:
+            return [TextContent(type="text", text=result_text)]
         
         return [TextContent(type="text", text="Timeout waiting for Unity")]
         
@@ -1368,25 +1743,10 @@ async def set_property(args: Dict[str, Any]) -> List[TextContent]:
     value = args.get("value", "")
     
     try:
-        command_dir = inspector.project_root / "Temp" / "KiroCommands"
-        command_dir.mkdir(parents=True, exist_ok=True)
-        
-        command_file = command_dir / "command.txt"
-        result_file = command_dir / "result.txt"
-        
-        if result_file.exists():
-            result_file.unlink()
-        
         command = f"set_property|{object_name}|{property_name}|{value}"
-        command_file.write_text(command)
-        
-        import time
-        for i in range(10):
-            time.sleep(0.5)
-            if result_file.exists():
-                result_text = result_file.read_text().strip()
-                result_file.unlink()
-                return [TextContent(type="text", text=result_text)]
+        result_text = await _send_command(command)
+        if result_text is not None:
+            return [TextContent(type="text", text=result_text)]
         
         return [TextContent(type="text", text="Timeout waiting for Unity")]
         
@@ -1399,25 +1759,10 @@ async def add_component(args: Dict[str, Any]) -> List[TextContent]:
     component_type = args.get("component_type", "")
     
     try:
-        command_dir = inspector.project_root / "Temp" / "KiroCommands"
-        command_dir.mkdir(parents=True, exist_ok=True)
-        
-        command_file = command_dir / "command.txt"
-        result_file = command_dir / "result.txt"
-        
-        if result_file.exists():
-            result_file.unlink()
-        
         command = f"add_component|{object_name}|{component_type}"
-        command_file.write_text(command)
-        
-        import time
-        for i in range(10):
-            time.sleep(0.5)
-            if result_file.exists():
-                result_text = result_file.read_text().strip()
-                result_file.unlink()
-                return [TextContent(type="text", text=result_text)]
+        result_text = await _send_command(command)
+        if result_text is not None:
+            return [TextContent(type="text", text=result_text)]
         
         return [TextContent(type="text", text="Timeout waiting for Unity")]
         
@@ -1430,25 +1775,10 @@ async def remove_component(args: Dict[str, Any]) -> List[TextContent]:
     component_type = args.get("component_type", "")
     
     try:
-        command_dir = inspector.project_root / "Temp" / "KiroCommands"
-        command_dir.mkdir(parents=True, exist_ok=True)
-        
-        command_file = command_dir / "command.txt"
-        result_file = command_dir / "result.txt"
-        
-        if result_file.exists():
-            result_file.unlink()
-        
         command = f"remove_component|{object_name}|{component_type}"
-        command_file.write_text(command)
-        
-        import time
-        for i in range(10):
-            time.sleep(0.5)
-            if result_file.exists():
-                result_text = result_file.read_text().strip()
-                result_file.unlink()
-                return [TextContent(type="text", text=result_text)]
+        result_text = await _send_command(command)
+        if result_text is not None:
+            return [TextContent(type="text", text=result_text)]
         
         return [TextContent(type="text", text="Timeout waiting for Unity")]
         
@@ -1463,25 +1793,10 @@ async def set_component_property(args: Dict[str, Any]) -> List[TextContent]:
     value = args.get("value", "")
     
     try:
-        command_dir = inspector.project_root / "Temp" / "KiroCommands"
-        command_dir.mkdir(parents=True, exist_ok=True)
-        
-        command_file = command_dir / "command.txt"
-        result_file = command_dir / "result.txt"
-        
-        if result_file.exists():
-            result_file.unlink()
-        
         command = f"set_component_property|{object_name}|{component_type}|{property_name}|{value}"
-        command_file.write_text(command)
-        
-        import time
-        for i in range(10):
-            time.sleep(0.5)
-            if result_file.exists():
-                result_text = result_file.read_text().strip()
-                result_file.unlink()
-                return [TextContent(type="text", text=result_text)]
+        result_text = await _send_command(command)
+        if result_text is not None:
+            return [TextContent(type="text", text=result_text)]
         
         return [TextContent(type="text", text="Timeout waiting for Unity")]
         
@@ -1491,93 +1806,105 @@ async def set_component_property(args: Dict[str, Any]) -> List[TextContent]:
 async def cleanup_screenshots(args: Dict[str, Any]) -> List[TextContent]:
     """Clean up old screenshots to save disk space"""
     keep_count = args.get("keep_count", 5)
+    # Stamped when the command is issued, shared by whichever result is returned
+    timestamp = datetime.now().isoformat()
     
     try:
-        # Create command file for Unity to process
-        command_dir = inspector.project_root / "Temp" / "KiroCommands"
-        command_dir.mkdir(parents=True, exist_ok=True)
-        
-        command_file = command_dir / "command.txt"
-        result_file = command_dir / "result.txt"
-        
-        # Remove old result file
-        if result_file.exists():
-            result_file.unlink()
-        
-        # Write command
         command = f"cleanup_screenshots|{int(keep_count)}"
-        command_file.write_text(command)
         
-        # Wait for Unity to process the command
-        import time
-        for i in range(10):  # Wait up to 5 seconds
-            time.sleep(0.5)
-            if result_file.exists():
-                result_text = result_file.read_text().strip()
-                result_file.unlink()  # Clean up
-                
-                result = {
-                    "success": True,
-                    "action": "cleanup_screenshots",
-                    "keep_count": keep_count,
-                    "message": result_text,
-                    "timestamp": datetime.now().isoformat()
-                }
-                
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        # Wait for Unity to process the command without blocking other tool calls
+        result_text = await _send_command(command)
+        if result_text is not None:
+            result = {
+                "success": True,
+                "action": "cleanup_screenshots",
+                "keep_count": keep_count,
+                "message": result_text,
+                "timestamp": timestamp
+            }
+            
+            return [TextContent(type="text", text=_dumps(result))]
         
         # Timeout
         result = {
             "success": False,
             "action": "cleanup_screenshots",
             "error": "Timeout waiting for Unity to process command",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [TextContent(type="text", text=_dumps(result))]
         
     except Exception as e:
         return [TextContent(type="text", text=f"Error cleaning up screenshots: {str(e)}")]
 
 async def force_refresh(args: Dict[str, Any]) -> List[TextContent]:
-    """Force Unity to refresh by creating a trigger file"""
+    """Force Unity to refresh by asking the editor to run AssetDatabase.Refresh"""
     reason = args.get("reason", "Manual refresh request")
+    timestamp = datetime.now().isoformat()
     
     try:
-        # Create a trigger file that Unity's auto-refresh will detect
-        trigger_file = inspector.project_root / "Assets" / "kiro_refresh_trigger.cs"
-        trigger_content = f"""// KIRO REFRESH TRIGGER - {datetime.now()}
-// This file forces Unity to refresh - it will be auto-deleted
-// Reason: {reason}
-using UnityEngine;
-public class KiroRefreshTrigger_{int(datetime.now().timestamp())} : MonoBehaviour {{ }}
-"""
-        
-        trigger_file.write_text(trigger_content, encoding='utf-8')
-        
-        # Immediately delete it to clean up
-        import time
-        time.sleep(0.1)  # Small delay to ensure Unity detects it
-        if trigger_file.exists():
-            trigger_file.unlink()
-        
-        result = {
-            "success": True,
-            "action": "force_refresh",
-            "reason": reason,
-            "timestamp": datetime.now().isoformat()
-        }
+        # A direct command replaces writing a trigger file into Assets for the watcher to notice
+        result_text = await _send_command(f"refresh|{reason}")
+        # Editor packages that predate the refresh command answer "Unknown command: refresh"
+        if result_text is not None and result_text.startswith("Asset refresh scheduled"):
+            result = {
+                "success": True,
+                "action": "force_refresh",
+                "reason": reason,
+                "message": result_text,
+                "timestamp": timestamp
+            }
+        else:
+            result = {
+                "success": False,
+                "action": "force_refresh",
+                "reason": reason,
+                "error": result_text or "Timeout waiting for Unity to process command",
+                "timestamp": timestamp
+            }
         
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [TextContent(type="text", text=_dumps(result))]
         
     except Exception as e:
         return [TextContent(type="text", text=f"Error forcing refresh: {str(e)}")]
 
+# Tool name -> handler, looked up once per call by handle_call_tool
+_DISPATCH: Dict[str, Callable[[Dict[str, Any]], Awaitable[List[TextContent]]]] = {
+    "unity_read_script": read_script,
+    "unity_create_script": create_script,
+    "unity_inspect_scene": inspect_scene,
+    "unity_list_gameobjects": list_gameobjects,
+    "unity_search_assets": search_assets,
+    "unity_get_project_overview": get_project_overview,
+    "unity_capture_screenshot": capture_screenshot,
+    "unity_capture_camera_view": capture_camera_view,
+    "unity_get_scene_info": get_scene_info,
+    "unity_get_scene_hierarchy": get_scene_hierarchy,
+    "unity_create_gameobject": create_gameobject,
+    "unity_delete_gameobject": delete_gameobject,
+    "unity_set_property": set_property,
+    "unity_add_component": add_component,
+    "unity_remove_component": remove_component,
+    "unity_set_component_property": set_component_property,
+    "unity_cleanup_screenshots": cleanup_screenshots,
+    "unity_force_refresh": force_refresh,
+}
+
 async def main():
     """Main entry point for the MCP server"""
+    asyncio.get_running_loop().set_default_executor(_FILE_POOL)
+    
     # Initialize the Unity project inspector
     if not initialize_inspector():
         print("Warning: Unity project not detected. Some features may not work.", file=sys.stderr)
+    else:
+        try:
+            _start_result_watcher(inspector.completion_dir)
+        except OSError as e:
+            print(f"Warning: Could not watch for command results, polling instead: {e}", file=sys.stderr)
+        # A tool call arriving mid-connect waits on the channel lock instead of connecting again
+        _spawn(_preconnect_channel())
     
     # Run the server
     async with stdio_server() as (read_stream, write_stream):
@@ -1594,5 +1921,22 @@ async def main():
             ),
         )
 
+def run():
+    """Run the server on uvloop (winloop on Windows) when it is installed, otherwise on the default asyncio loop"""
+    try:
+        if sys.platform == "win32":
+            import winloop as uvloop
+        else:
+            import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        if hasattr(uvloop, "run"):
+            uvloop.run(main())
+        else:
+            # Releases before uvloop 0.18 have no run(); install the policy instead
+            uvloop.install()
+            asyncio.run(main())
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run()
\ No newline at end of file
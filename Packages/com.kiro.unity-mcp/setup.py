@@ -3,6 +3,8 @@
 Setup script for Unity MCP Server
 """
 
+import importlib.util
+import shutil
 import subprocess
 import sys
 import os
@@ -12,10 +14,18 @@ def install_requirements():
     """Install required Python packages"""
     requirements_file = Path(__file__).parent / "Runtime" / "requirements.txt"
     
+    # uv resolves and installs much faster when present; target this interpreter either way
+    if shutil.which("uv"):
+        command = ["uv", "pip", "install", "--python", sys.executable, "-r", str(requirements_file)]
+    else:
+        command = [
+            sys.executable, "-m", "pip", "install",
+            "--disable-pip-version-check", "--no-input",
+            "-r", str(requirements_file)
+        ]
+    
     try:
-        subprocess.check_call([
-            sys.executable, "-m", "pip", "install", "-r", str(requirements_file)
-        ])
+        subprocess.check_call(command)
         print("✅ Successfully installed Python requirements")
         return True
     except subprocess.CalledProcessError as e:
@@ -27,18 +37,18 @@ def test_mcp_server():
     server_file = Path(__file__).parent / "Runtime" / "UnityMCPServer.py"
     
     try:
-        # Test import
-        result = subprocess.run([
-            sys.executable, "-c", 
-            f"import sys; sys.path.insert(0, '{server_file.parent}'); import UnityMCPServer"
-        ], capture_output=True, text=True)
+        # Import in this interpreter instead of paying for a second one; packages pip
+        # just installed are only visible once the import caches are rebuilt
+        importlib.invalidate_caches()
+        spec = importlib.util.spec_from_file_location("UnityMCPServer", server_file)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
         
-        if result.returncode == 0:
-            print("✅ MCP server can be imported successfully")
-            return True
-        else:
-            print(f"❌ Failed to import MCP server: {result.stderr}")
-            return False
+        print("✅ MCP server can be imported successfully")
+        return True
+    except ImportError as e:
+        print(f"❌ Failed to import MCP server: {e}")
+        return False
     except Exception as e:
         print(f"❌ Error testing MCP server: {e}")
         return False